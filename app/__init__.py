@@ -4,41 +4,14 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
-import os
+__all__ = ["create_app"]
 
-from apiflask import APIFlask
 
-from app.ro_crates.routes import v1_post_bp, v1_get_bp
-from app.utils.config import DevelopmentConfig, ProductionConfig, InvalidAPIUsage, make_celery
-from flask import jsonify
-
-
-def create_app() -> APIFlask:
-    """
-    Creates and configures Flask application.
-
-    :return: Flask: A configured Flask application instance.
-    """
-    app = APIFlask(__name__)
-    app.register_blueprint(v1_post_bp, url_prefix="/v1/ro_crates")
-    app.register_blueprint(v1_get_bp, url_prefix="/v1/ro_crates")
-
-    @app.errorhandler(InvalidAPIUsage)
-    def invalid_api_usage(e):
-        return jsonify(e.to_dict()), e.status_code
-
-    # Load configuration:
-    if os.getenv("FLASK_ENV") == "production":
-        app.config.from_object(ProductionConfig)
-    else:
-        # Development environment:
-        app.debug = True
-        print("URL Map:")
-        for rule in app.url_map.iter_rules():
-            print(rule)
-        app.config.from_object(DevelopmentConfig)
-
-    # Integrate Celery
-    make_celery(app)
-
-    return app
+def __getattr__(name: str):
+    # Defer the Flask, blueprint and validator imports until the application factory is
+    # requested, so that processes which only need a submodule (e.g. the Celery worker)
+    # do not pay for them.
+    if name == "create_app":
+        from app._factory import create_app
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
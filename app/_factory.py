@@ -0,0 +1,59 @@
+"""Application factory: creates the Flask app and registers the application blueprints."""
+
+# Author: Alexander Hambley
+# License: MIT
+# Copyright (c) 2025 eScience Lab, The University of Manchester
+
+import logging
+import os
+
+from apiflask import APIFlask
+from flask import jsonify, Response
+
+
+logger = logging.getLogger(__name__)
+
+
+def invalid_api_usage(e) -> tuple[Response, int]:
+    """
+    Renders an InvalidAPIUsage error as a JSON response.
+
+    :param e: The InvalidAPIUsage error raised.
+    :return: A tuple containing the JSON error body and its HTTP status code.
+    """
+    return jsonify(e.to_dict()), e.status_code
+
+
+def create_app() -> APIFlask:
+    """
+    Creates and configures Flask application.
+
+    :return: Flask: A configured Flask application instance.
+    """
+    app = APIFlask(__name__)
+
+    from app.ro_crates.routes import v1_post_bp, v1_get_bp
+    from app.utils.config import DevelopmentConfig, ProductionConfig, InvalidAPIUsage, make_celery
+    from app.utils.json_provider import ORJSONProvider
+
+    app.json = ORJSONProvider(app)
+
+    app.register_blueprint(v1_post_bp, url_prefix="/v1/ro_crates")
+    app.register_blueprint(v1_get_bp, url_prefix="/v1/ro_crates")
+
+    app.register_error_handler(InvalidAPIUsage, invalid_api_usage)
+
+    # Load configuration:
+    if os.getenv("FLASK_ENV") == "production":
+        app.config.from_object(ProductionConfig)
+    else:
+        # Development environment:
+        app.debug = True
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("URL Map:\n%s", "\n".join(str(rule) for rule in app.url_map.iter_rules()))
+        app.config.from_object(DevelopmentConfig)
+
+    # Integrate Celery
+    make_celery(app)
+
+    return app
@@ -4,7 +4,66 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
+import os
+
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown, worker_shutdown
+
+from app.utils.config import configure_celery_worker
+
+
+# The worker imports the task modules itself, as the ``app`` package loads lazily:
+celery = Celery(include=["app.tasks.validation_tasks", "app.tasks.webhook_tasks"])
+configure_celery_worker(celery)
+
+
+@worker_init.connect
+def preload_validation_modules(**kwargs) -> None:
+    """
+    Imports the SHACL validation stack in the worker's main process, before the pool starts.
+
+    rocrate_validator only imports pyshacl when the first validation runs. Importing it here
+    removes that cost from the first task, and lets prefork children share the loaded modules.
+    The loaded validation profiles and fetched JSON-LD contexts are also cached from here on, and
+    the configured profiles are parsed once up front. The Flask process, which also imports this
+    module, is unaffected.
+    """
+    import pyshacl  # noqa: F401
+    from rocrate_validator import services
+    from rocrate_validator.models import Severity
+
+    from app.utils.config import Config
+    from app.utils.jsonld_cache import enable_jsonld_context_cache
+    from app.utils.profile_cache import enable_profile_cache
+
+    enable_profile_cache()
+    enable_jsonld_context_cache()
+    services.get_profiles(
+        Config.PROFILES_PATH or services.DEFAULT_PROFILES_PATH, severity=Severity.REQUIRED
+    )
+
+
+@worker_init.connect
+def create_validation_temp_dir(**kwargs) -> None:
+    """
+    Creates the directory RO-Crates are downloaded into for validation, if one is configured.
+    """
+    from app.utils.config import Config
+
+    if Config.VALIDATION_TEMP_DIR:
+        os.makedirs(Config.VALIDATION_TEMP_DIR, exist_ok=True)
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def remove_scratch_dir(**kwargs) -> None:
+    """
+    Removes the RO-Crate download directory of the process that ran the tasks, along with any downloads a task did
+    not clean up.
 
+    The directory is created by the first download. Prefork pool processes remove it when they exit, while the gevent,
+    threads and solo pools run tasks in the main process, which removes it at worker shutdown.
+    """
+    from app.utils.minio_utils import remove_worker_scratch_dir
 
-celery = Celery()
+    remove_worker_scratch_dir()
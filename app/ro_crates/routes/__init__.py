@@ -4,8 +4,7 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
-from app.ro_crates.routes.post_routes import post_routes_bp
-from app.ro_crates.routes.get_routes import get_routes_bp
+from app.ro_crates.routes.post_routes import post_routes_bp as v1_post_bp
+from app.ro_crates.routes.get_routes import get_routes_bp as v1_get_bp
 
-v1_post_bp = post_routes_bp
-v1_get_bp = get_routes_bp
+__all__ = ["v1_post_bp", "v1_get_bp"]
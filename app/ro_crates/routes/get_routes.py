@@ -4,31 +4,20 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
-from apiflask import APIBlueprint, Schema
-from apiflask.fields import String, Boolean
-from marshmallow.fields import Nested
+from apiflask import APIBlueprint
 from flask import Response
 
-from app.services.validation_service import get_ro_crate_validation_task
+from app.services.validation_service import (
+    get_ro_crate_validation_task,
+    get_metadata_validation_task_result
+)
+from app.ro_crates.routes.schemas import VALIDATE_RESULT
 
 get_routes_bp = APIBlueprint("get_routes", __name__)
 
 
-class MinioConfig(Schema):
-    endpoint = String(required=True)
-    accesskey = String(required=True)
-    secret = String(required=True)
-    ssl = Boolean(required=True)
-    bucket = String(required=True)
-
-
-class ValidateResult(Schema):
-    minio_config = Nested(MinioConfig, required=True)
-    root_path = String(required=False)
-
-
 @get_routes_bp.get("<string:crate_id>/validation")
-@get_routes_bp.input(ValidateResult(partial=False), location='json')
+@get_routes_bp.input(VALIDATE_RESULT, location='json')
 def get_ro_crate_validation_by_id(json_data, crate_id) -> tuple[Response, int]:
     """
     Endpoint to obtain an RO-Crate validation result using its ID from MinIO.
@@ -53,10 +42,21 @@ def get_ro_crate_validation_by_id(json_data, crate_id) -> tuple[Response, int]:
     """
 
     minio_config = json_data["minio_config"]
-
-    if "root_path" in json_data:
-        root_path = json_data["root_path"]
-    else:
-        root_path = None
+    root_path = json_data.get("root_path")
 
     return get_ro_crate_validation_task(minio_config, crate_id, root_path)
+
+
+@get_routes_bp.get("tasks/<string:task_id>")
+def get_metadata_validation_by_task_id(task_id) -> tuple[Response, int]:
+    """
+    Endpoint to obtain the result of a metadata validation task using its task ID.
+
+    Path Parameters:
+    - **task_id**: The task ID returned when the validation was queued. _Required_.
+
+    Returns:
+    - A tuple containing the validation result, or an in-progress message, and an HTTP status code.
+    """
+
+    return get_metadata_validation_task_result(task_id)
@@ -4,41 +4,20 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
-from apiflask import APIBlueprint, Schema
-from apiflask.fields import String, Boolean
-from marshmallow.fields import Nested
+from apiflask import APIBlueprint
 from flask import Response, current_app
 
 from app.services.validation_service import (
     queue_ro_crate_validation_task,
     queue_ro_crate_metadata_validation_task
 )
+from app.ro_crates.routes.schemas import VALIDATE_CRATE, VALIDATE_JSON
 
 post_routes_bp = APIBlueprint("post_routes", __name__)
 
 
-class MinioConfig(Schema):
-    endpoint = String(required=True)
-    accesskey = String(required=True)
-    secret = String(required=True)
-    ssl = Boolean(required=True)
-    bucket = String(required=True)
-
-
-class ValidateCrate(Schema):
-    minio_config = Nested(MinioConfig, required=True)
-    root_path = String(required=False)
-    profile_name = String(required=False)
-    webhook_url = String(required=False)
-
-
-class ValidateJSON(Schema):
-    crate_json = String(required=True)
-    profile_name = String(required=False)
-
-
 @post_routes_bp.post("<string:crate_id>/validation")
-@post_routes_bp.input(ValidateCrate(partial=False), location='json')
+@post_routes_bp.input(VALIDATE_CRATE, location='json')
 def validate_ro_crate_via_id(json_data, crate_id) -> tuple[Response, int]:
     """
     Endpoint to validate an RO-Crate using its ID from MinIO.
@@ -65,21 +44,9 @@ def validate_ro_crate_via_id(json_data, crate_id) -> tuple[Response, int]:
     """
 
     minio_config = json_data["minio_config"]
-
-    if "root_path" in json_data:
-        root_path = json_data["root_path"]
-    else:
-        root_path = None
-
-    if "webhook_url" in json_data:
-        webhook_url = json_data["webhook_url"]
-    else:
-        webhook_url = None
-
-    if "profile_name" in json_data:
-        profile_name = json_data["profile_name"]
-    else:
-        profile_name = None
+    root_path = json_data.get("root_path")
+    webhook_url = json_data.get("webhook_url")
+    profile_name = json_data.get("profile_name")
 
     profiles_path = current_app.config["PROFILES_PATH"]
 
@@ -88,7 +55,7 @@ def validate_ro_crate_via_id(json_data, crate_id) -> tuple[Response, int]:
 
 
 @post_routes_bp.post("/validate_metadata")
-@post_routes_bp.input(ValidateJSON(partial=False), location='json')  # -> json_data
+@post_routes_bp.input(VALIDATE_JSON, location='json')  # -> json_data
 def validate_ro_crate_metadata(json_data) -> tuple[Response, int]:
     """
     Endpoint to validate an RO-Crate JSON file uploaded to the Service.
@@ -98,19 +65,18 @@ def validate_ro_crate_metadata(json_data) -> tuple[Response, int]:
     - **profile_name**: The profile name for validation. _Optional_.
 
     Returns:
-    - A tuple containing the validation task's response and an HTTP status code.
+    - A tuple containing the validation task's response and an HTTP status code. If the validation
+      does not complete in time, a 202 response with the task ID is returned instead.
 
     Raises:
     - KeyError: If required parameters (`crate_json`) are missing.
     """
 
     crate_json = json_data["crate_json"]
-
-    if "profile_name" in json_data:
-        profile_name = json_data["profile_name"]
-    else:
-        profile_name = None
+    profile_name = json_data.get("profile_name")
 
     profiles_path = current_app.config["PROFILES_PATH"]
+    result_timeout = current_app.config["METADATA_VALIDATION_TIMEOUT"]
 
-    return queue_ro_crate_metadata_validation_task(crate_json, profile_name, profiles_path=profiles_path)
+    return queue_ro_crate_metadata_validation_task(crate_json, profile_name, profiles_path=profiles_path,
+                                                   result_timeout=result_timeout)
@@ -0,0 +1,39 @@
+"""Defines the request schemas shared by the RO-Crate API endpoints."""
+
+# Author: Alexander Hambley
+# License: MIT
+# Copyright (c) 2025 eScience Lab, The University of Manchester
+
+from apiflask import Schema
+from marshmallow.fields import Boolean, Nested, String
+
+
+class MinioConfig(Schema):
+    endpoint = String(required=True)
+    accesskey = String(required=True)
+    secret = String(required=True)
+    ssl = Boolean(required=True)
+    bucket = String(required=True)
+
+
+class ValidateCrate(Schema):
+    minio_config = Nested(MinioConfig, required=True)
+    root_path = String(required=False)
+    profile_name = String(required=False)
+    webhook_url = String(required=False)
+
+
+class ValidateJSON(Schema):
+    crate_json = String(required=True)
+    profile_name = String(required=False)
+
+
+class ValidateResult(Schema):
+    minio_config = Nested(MinioConfig, required=True)
+    root_path = String(required=False)
+
+
+# Schema instances are shared by the route decorators, rather than built per endpoint:
+VALIDATE_CRATE = ValidateCrate(partial=False)
+VALIDATE_JSON = ValidateJSON(partial=False)
+VALIDATE_RESULT = ValidateResult(partial=False)
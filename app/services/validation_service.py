@@ -6,7 +6,12 @@
 
 import logging
 import json
+from threading import Lock
 
+from cachetools import TTLCache
+from celery import states
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.utils import uuid
 from flask import jsonify, Response
 
 from app.tasks.validation_tasks import (
@@ -14,15 +19,36 @@ from app.tasks.validation_tasks import (
     process_validation_task_by_metadata,
     return_ro_crate_validation,
     check_ro_crate_exists,
-    check_validation_exists
+    check_ro_crate_and_validation_exist
     )
 
-from app.utils.config import InvalidAPIUsage
-from app.utils.minio_utils import get_minio_client
+from app.utils.config import Config, InvalidAPIUsage
+from app.utils.lock_utils import acquire_validation_lock, release_validation_lock, validation_lock_key
+from app.utils.minio_utils import get_minio_client, get_validation_status_etag
 
 
 logger = logging.getLogger(__name__)
 
+# Positive RO-Crate existence checks are remembered for a short time, so that repeated
+# validation requests for the same crate do not each wait on a MinIO listing:
+ROCRATE_EXISTS_CACHE_TTL = 30
+_rocrate_exists_cache = TTLCache(maxsize=4096, ttl=ROCRATE_EXISTS_CACHE_TTL)
+
+# Validation results are cached with the ETag of the stored result, so that clients polling for
+# a result only trigger a single MinIO stat request while it is unchanged:
+_validation_result_cache = TTLCache(maxsize=1024, ttl=Config.VALIDATION_RESULT_CACHE_TTL)
+
+_cache_lock = Lock()
+
+# State recorded in the result backend for a metadata validation before it is queued. Celery reports
+# any task ID it has no record of as PENDING, so this tells a queued task apart from an unknown or
+# expired ID. The worker replaces it with the task's own states:
+METADATA_TASK_QUEUED_STATE = "QUEUED"
+
+
+def _minio_cache_key(minio_config: dict, crate_id: str, root_path: str | None) -> tuple:
+    return (minio_config["endpoint"], minio_config["accesskey"], minio_config["bucket"], crate_id, root_path)
+
 
 def queue_ro_crate_validation_task(
     minio_config, crate_id, root_path=None, profile_name=None, webhook_url=None,
@@ -40,44 +66,88 @@ def queue_ro_crate_validation_task(
     :raises: Exception: If an error occurs whilst queueing the task.
     """
 
-    logging.info(f"Processing: {crate_id}, {profile_name}, {webhook_url}")
-    logging.info(f"Minio Bucket: {minio_config['bucket']}; Root path: {root_path}")
+    logger.info("Processing: %s, %s, %s", crate_id, profile_name, webhook_url)
+    logger.info("Minio Bucket: %s; Root path: %s", minio_config['bucket'], root_path)
 
-    minio_client = get_minio_client(minio_config)
-
-    if check_ro_crate_exists(minio_client, minio_config["bucket"], crate_id, root_path):
-        logging.info("RO-Crate exists")
+    if check_ro_crate_exists_cached(minio_config, crate_id, root_path):
+        logger.info("RO-Crate exists")
     else:
-        logging.info("RO-Crate does not exist")
+        logger.info("RO-Crate does not exist")
         raise InvalidAPIUsage(f"No RO-Crate with prefix: {crate_id}", 400)
 
+    # An identical request which is still queued or running is not queued again:
+    lock_key = validation_lock_key(minio_config, crate_id, root_path, profile_name, webhook_url)
+    if not acquire_validation_lock(lock_key):
+        logger.info("Validation of %s already in progress", crate_id)
+        return jsonify({"message": "Validation in progress"}), 202
+
     try:
         process_validation_task_by_id.delay(minio_config, crate_id, root_path,
                                             profile_name, webhook_url, profiles_path)
         return jsonify({"message": "Validation in progress"}), 202
 
     except Exception as e:
+        release_validation_lock(lock_key)
         return jsonify({"error": str(e)}), 500
 
 
+def check_ro_crate_exists_cached(minio_config: dict, crate_id: str, root_path: str | None) -> bool:
+    """
+    Checks for the existence of an RO-Crate, reusing recent positive results.
+
+    Only crates that were found are cached, so a newly uploaded crate is seen immediately.
+    The validation task itself fails if a cached crate has since been removed.
+
+    :param minio_config: Access settings for Minio instance containing the RO-Crate.
+    :param crate_id: The ID of the RO-Crate to check.
+    :param root_path: The root path containing the RO-Crate.
+    :return: Boolean indicating existence
+    """
+
+    key = _minio_cache_key(minio_config, crate_id, root_path)
+
+    with _cache_lock:
+        if key in _rocrate_exists_cache:
+            return True
+
+    minio_client = get_minio_client(minio_config)
+
+    if not check_ro_crate_exists(minio_client, minio_config["bucket"], crate_id, root_path):
+        return False
+
+    with _cache_lock:
+        _rocrate_exists_cache[key] = True
+    return True
+
+
 def queue_ro_crate_metadata_validation_task(
-    crate_json: str, profile_name=None, webhook_url=None, profiles_path=None
+    crate_json: str, profile_name=None, webhook_url=None, profiles_path=None,
+    result_timeout: float = Config.METADATA_VALIDATION_TIMEOUT
 ) -> tuple[Response, int]:
     """
     Queues an RO-Crate for validation with Celery.
 
+    Without a webhook, the result is returned directly if the validation completes within
+    `result_timeout` seconds. Otherwise the task ID is returned, so that the result can be
+    collected from the task status endpoint.
+
     :param crate_id: The ID of the RO-Crate to validate.
     :param profile_name: The profile to validate against.
     :param webhook_url: The URL to POST the validation results to.
     :param profiles_path: A path to the profile definition directory.
+    :param result_timeout: Seconds to wait for the validation result.
     :return: A tuple containing a JSON response and an HTTP status code.
     :raises: Exception: If an error occurs whilst queueing the task.
     """
 
-    logging.info(f"Processing: {crate_json}, {profile_name}, {webhook_url}")
+    logger.info("Processing: %s, %s, %s", crate_json, profile_name, webhook_url)
 
-    if not crate_json:
+    # Reject blank and trivially empty payloads before parsing anything:
+    stripped_json = crate_json.strip() if crate_json else ""
+    if not stripped_json:
         return jsonify({"error": "Missing required parameter: crate_json"}), 422
+    if stripped_json in ("{}", "[]"):
+        return jsonify({"error": "Required parameter crate_json is empty"}), 422
 
     try:
         json_dict = json.loads(crate_json)
@@ -88,21 +158,55 @@ def queue_ro_crate_metadata_validation_task(
             return jsonify({"error": "Required parameter crate_json is empty"}), 422
 
     try:
-        result = process_validation_task_by_metadata.delay(
-                                                     crate_json,
-                                                     profile_name,
-                                                     webhook_url,
-                                                     profiles_path
-                )
+        # Pass the parsed metadata on, so that the worker does not decode it a second time. With a
+        # webhook the result is delivered there and never read back, so it is not stored either:
+        task_id = uuid()
+        if not webhook_url:
+            process_validation_task_by_metadata.backend.store_result(task_id, None, METADATA_TASK_QUEUED_STATE)
+
+        result = process_validation_task_by_metadata.apply_async(
+            args=(json_dict, profile_name, webhook_url, profiles_path),
+            ignore_result=bool(webhook_url),
+            task_id=task_id,
+        )
         if webhook_url:
             return jsonify({"message": "Validation in progress"}), 202
         else:
-            return jsonify({"result": result.get()}), 200
+            return jsonify({"result": result.get(timeout=result_timeout)}), 200
+
+    except CeleryTimeoutError:
+        logger.info("Metadata validation task %s still running after %ss", result.id, result_timeout)
+        return jsonify({"message": "Validation in progress", "task_id": result.id}), 202
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+def get_metadata_validation_task_result(task_id: str) -> tuple[Response, int]:
+    """
+    Retrieves the result of a queued metadata validation task, without waiting for it.
+
+    :param task_id: The ID of the Celery task running the validation.
+    :return: A tuple containing a JSON response and an HTTP status code.
+    :raises InvalidAPIUsage: If there is no task with the ID, or its result has expired, 404
+    """
+
+    logger.info("Retrieving metadata validation task: %s", task_id)
+
+    result = process_validation_task_by_metadata.AsyncResult(task_id)
+
+    if result.state == states.PENDING:
+        raise InvalidAPIUsage(f"No metadata validation task with ID: {task_id}", 404)
+
+    if not result.ready():
+        return jsonify({"message": "Validation in progress", "task_id": task_id}), 202
+
+    if result.failed():
+        return jsonify({"error": str(result.result)}), 500
+
+    return jsonify({"result": result.result}), 200
+
+
 def get_ro_crate_validation_task(
     minio_config: dict,
     crate_id: str,
@@ -111,26 +215,51 @@ def get_ro_crate_validation_task(
     """
     Retrieves an RO-Crate validation result.
 
+    Results are kept in memory for `VALIDATION_RESULT_CACHE_TTL` seconds after they are first
+    fetched. Once the RO-Crate and its result have been found, a kept result is served while the
+    ETag of the stored result is unchanged, so a result replaced by any worker is read again and
+    one whose RO-Crate has been removed is not served.
+
     :param minio_config: Access settings for Minio instance containing the RO-Crate.
     :param crate_id: The ID of the RO-Crate to validate.
     :param root_path: The root path containing the RO-Crate.
     :return: A tuple containing a JSON response and an HTTP status code.
     :raises Exception: If an error occurs whilst retreiving validation result
     """
-    logging.info(f"Retrieving validation for: {crate_id}")
+    logger.info("Retrieving validation for: %s", crate_id)
 
+    key = _minio_cache_key(minio_config, crate_id, root_path)
     minio_client = get_minio_client(minio_config)
 
-    if check_ro_crate_exists(minio_client, minio_config["bucket"], crate_id, root_path):
-        logging.info("RO-Crate exists")
+    crate_exists, validation_exists = check_ro_crate_and_validation_exist(
+        minio_client, minio_config["bucket"], crate_id, root_path
+    )
+
+    if crate_exists:
+        logger.info("RO-Crate exists")
     else:
-        logging.info("RO-Crate does not exist")
+        logger.info("RO-Crate does not exist")
         raise InvalidAPIUsage(f"No RO-Crate with prefix: {crate_id}", 400)
 
-    if check_validation_exists(minio_client, minio_config["bucket"], crate_id, root_path):
-        logging.info("Validation result exists")
+    if validation_exists:
+        logger.info("Validation result exists")
     else:
-        logging.info("Validation does not exist")
+        logger.info("Validation does not exist")
         raise InvalidAPIUsage(f"No validation result yet for RO-Crate: {crate_id}", 400)
 
-    return return_ro_crate_validation(minio_client, minio_config["bucket"], crate_id, root_path), 200
+    # Checked before the result is read, so a result replaced in between is read again next time:
+    etag = get_validation_status_etag(minio_client, minio_config["bucket"], crate_id, root_path)
+
+    with _cache_lock:
+        cached = _validation_result_cache.get(key)
+    if etag and cached is not None and cached[0] == etag:
+        logger.info("Validation result served from cache")
+        return cached[1], 200
+
+    validation_result = return_ro_crate_validation(minio_client, minio_config["bucket"], crate_id, root_path)
+
+    if etag:
+        with _cache_lock:
+            _validation_result_cache[key] = (etag, validation_result)
+
+    return validation_result, 200
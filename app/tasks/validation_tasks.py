@@ -4,30 +4,38 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
+import json
 import logging
 import os
 import shutil
-import json
 from typing import Optional
 
 from rocrate_validator import services
-from rocrate_validator.models import ValidationResult
+from rocrate_validator.models import CustomEncoder, ValidationResult
 
 from app.celery_worker import celery
 from app.utils.minio_utils import (
     fetch_ro_crate_from_minio,
+    get_cached_validation_status,
+    get_ro_crate_fingerprint,
     update_validation_status_in_minio,
     get_validation_status_from_minio,
     get_minio_client,
     find_rocrate_object_on_minio,
     find_validation_object_on_minio,
+    find_rocrate_and_validation_on_minio,
 )
-from app.utils.webhook_utils import send_webhook_notification
+from app.utils.lock_utils import release_validation_lock, validation_lock_key
+from app.utils.profile_cache import profiles_fingerprint
+from app.tasks.webhook_tasks import deliver_webhook_notification
 
 logger = logging.getLogger(__name__)
 
+# Relative RO-Crate paths are resolved against the repository root:
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-@celery.task
+
+@celery.task(ignore_result=True)
 def process_validation_task_by_id(
     minio_config: dict,
     crate_id: str,
@@ -55,12 +63,27 @@ def process_validation_task_by_id(
     file_path = None
 
     try:
+        # Skip the validation if the RO-Crate and profile are unchanged since the stored result:
+        fingerprint = get_ro_crate_fingerprint(
+            minio_client, minio_config["bucket"], crate_id, root_path, profile_name,
+            validator_fingerprint=profiles_fingerprint(profiles_path),
+        )
+        cached_result = get_cached_validation_status(
+            minio_client, minio_config["bucket"], crate_id, root_path, fingerprint
+        )
+
+        if cached_result is not None:
+            logger.info("RO Crate %s is unchanged since its last validation.", crate_id)
+            if webhook_url:
+                deliver_webhook_notification.delay(webhook_url, json.dumps(cached_result))
+            return
+
         # Fetch the RO-Crate from MinIO using the provided ID:
         file_path = fetch_ro_crate_from_minio(
             minio_client, minio_config["bucket"], crate_id, root_path
         )
 
-        logging.info(f"Processing validation task for {file_path}")
+        logger.info("Processing validation task for %s", file_path)
 
         # Perform validation:
         validation_result = perform_ro_crate_validation(
@@ -68,14 +91,17 @@ def process_validation_task_by_id(
         )
 
         if isinstance(validation_result, str):
-            logging.error(f"Validation failed: {validation_result}")
+            logger.error("Validation failed: %s", validation_result)
             # TODO: Send webhook with failure notification
             raise Exception(f"Validation failed: {validation_result}")
 
         if not validation_result.has_issues():
-            logging.info(f"RO Crate {crate_id} is valid.")
+            logger.info("RO Crate %s is valid.", crate_id)
         else:
-            logging.info(f"RO Crate {crate_id} is invalid.")
+            logger.info("RO Crate %s is invalid.", crate_id)
+
+        # Serialise the report once, for both MinIO and the webhook:
+        result_json = serialise_validation_result(validation_result)
 
         # Update the validation status in MinIO:
         update_validation_status_in_minio(
@@ -83,44 +109,47 @@ def process_validation_task_by_id(
             minio_config["bucket"],
             crate_id,
             root_path,
-            validation_result.to_json(),
+            result_json,
+            fingerprint=fingerprint,
         )
 
         # TODO: Prepare the data to send to the webhook, and send the webhook notification.
 
         if webhook_url:
-            send_webhook_notification(webhook_url, validation_result.to_json())
+            deliver_webhook_notification.delay(webhook_url, result_json)
 
     except Exception as e:
-        logging.error(f"Error processing validation task: {e}")
+        logger.error("Error processing validation task: %s", e)
 
         # TODO: Should we write error messages to the minio instance too?
 
         # Send failure notification via webhook
         if webhook_url:
             error_data = {"profile_name": profile_name, "error": str(e)}
-            send_webhook_notification(webhook_url, error_data)
+            deliver_webhook_notification.delay(webhook_url, error_data)
 
     finally:
-        # Clean up the temporary file if it was created:
-        if file_path and os.path.exists(file_path):
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-            elif os.path.isdir(file_path):
-                shutil.rmtree(file_path)
+        # Clean up the temporary directory the RO-Crate was downloaded into, if it was created:
+        if file_path:
+            shutil.rmtree(os.path.dirname(file_path), ignore_errors=True)
+
+        # Allow the same validation to be requested again:
+        release_validation_lock(
+            validation_lock_key(minio_config, crate_id, root_path, profile_name, webhook_url)
+        )
 
 
 @celery.task
 def process_validation_task_by_metadata(
-    crate_json: str,
+    crate_metadata: dict,
     profile_name: str | None,
     webhook_url: str | None,
     profiles_path: Optional[str] = None,
 ) -> ValidationResult | str:
     """
-    Background task to process the RO-Crate validation for a given json metadata string.
+    Background task to process the RO-Crate validation for the given JSON metadata.
 
-    :param crate_json: A string containing the RO-Crate JSON metadata to validate.
+    :param crate_metadata: A dictionary containing the parsed RO-Crate JSON metadata to validate.
     :param profile_name: The name of the validation profile to use. Defaults to None.
     :param webhook_url: The webhook URL to send notifications to. Defaults to None.
     :param profiles_path: The path to the profiles definition directory. Defaults to None.
@@ -129,40 +158,82 @@ def process_validation_task_by_metadata(
     :todo: Replace the Crate ID with a more comprehensive system, and replace profile name with URI.
     """
 
+    validation_result = None
+
     try:
-        logging.info("Processing validation task for provided metadata string")
+        logger.info("Processing validation task for provided metadata string")
 
         # Perform validation:
         validation_result = perform_metadata_validation(
-            crate_json, profile_name, profiles_path=profiles_path
+            crate_metadata, profile_name, profiles_path=profiles_path
         )
 
         if isinstance(validation_result, str):
-            logging.error(f"Validation failed: {validation_result}")
+            logger.error("Validation failed: %s", validation_result)
             # TODO: Send webhook with failure notification
             raise Exception(f"Validation failed: {validation_result}")
 
         if not validation_result.has_issues():
-            logging.info("RO Crate metadata is valid.")
+            logger.info("RO Crate metadata is valid.")
         else:
-            logging.info("RO Crate metadata is invalid.")
+            logger.info("RO Crate metadata is invalid.")
+
+        # Serialise the report once, for both the webhook and the task result:
+        result_json = serialise_validation_result(validation_result)
 
         if webhook_url:
-            send_webhook_notification(webhook_url, validation_result.to_json())
+            deliver_webhook_notification.delay(webhook_url, result_json)
 
     except Exception as e:
-        logging.error(f"Error processing validation task: {e}")
+        logger.error("Error processing validation task: %s", e)
 
         # Send failure notification via webhook
         error_data = {"profile_name": profile_name, "error": str(e)}
         if webhook_url:
-            send_webhook_notification(webhook_url, error_data)
+            deliver_webhook_notification.delay(webhook_url, error_data)
+
+        return validation_result if isinstance(validation_result, str) else str(e)
+
+    return result_json
+
+
+def serialise_validation_result(validation_result: ValidationResult) -> str:
+    """
+    Serialises a validation result as compact JSON.
+
+    `ValidationResult.to_json` indents its output, which would have to be parsed and re-serialised before storing it.
+
+    :param validation_result: The validation result.
+    :return: The validation result as a JSON string.
+    """
+
+    return json.dumps(validation_result.to_dict(), cls=CustomEncoder)
 
-    finally:
-        if isinstance(validation_result, str):
-            return validation_result
-        else:
-            return validation_result.to_json()
+
+def validation_settings_kwargs(
+    profile_name: str | None,
+    skip_checks_list: Optional[list],
+    profiles_path: Optional[str],
+    **settings,
+) -> dict:
+    """
+    Builds the keyword arguments for `ValidationSettings`, leaving out options that are not set.
+
+    :param profile_name: The name of the validation profile to use, if any.
+    :param skip_checks_list: A list of checks to skip, if any.
+    :param profiles_path: The path to the profiles definition directory, if any.
+    :param settings: Further settings which are always passed.
+    :return: The keyword arguments.
+    """
+
+    if profile_name:
+        settings["profile_identifier"] = profile_name
+    if skip_checks_list:
+        settings["skip_checks"] = skip_checks_list
+    if profiles_path:
+        settings["profiles_path"] = profiles_path
+
+    return settings
 
 
 def perform_ro_crate_validation(
@@ -184,38 +255,30 @@ def perform_ro_crate_validation(
     """
 
     try:
-        logging.info(f"Validating {file_path} with profile {profile_name}")
+        logger.info("Validating %s with profile %s", file_path, profile_name)
 
-        full_file_path = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            file_path,
-        )
+        full_file_path = os.path.join(PROJECT_ROOT, file_path)
         settings = services.ValidationSettings(
-            rocrate_uri=full_file_path,
-            **({"profile_identifier": profile_name} if profile_name else {}),
-            **({"skip_checks": skip_checks_list} if skip_checks_list else {}),
-            **({"profiles_path": profiles_path} if profiles_path else {}),
+            **validation_settings_kwargs(profile_name, skip_checks_list, profiles_path, rocrate_uri=full_file_path)
         )
 
         return services.validate(settings)
 
     except Exception as e:
-        logging.error(f"Unexpected error during validation: {e}")
+        logger.error("Unexpected error during validation: %s", e)
         return str(e)
 
 
 def perform_metadata_validation(
-    crate_json: str,
+    crate_metadata: dict,
     profile_name: str | None,
     skip_checks_list: Optional[list] = None,
     profiles_path: Optional[str] = None,
 ) -> ValidationResult | str:
     """
-    Validates only RO-Crate metadata provided as a json string.
+    Validates only RO-Crate metadata provided as a parsed JSON dictionary.
 
-    :param crate_json: The JSON string containing the metadata
+    :param crate_metadata: The dictionary containing the metadata
     :param profile_name: The name of the validation profile to use. Defaults to None. If None, the CRS4 validator will
         attempt to determine the profile.
     :param profiles_path: The path to the profiles definition directory
@@ -225,20 +288,18 @@ def perform_metadata_validation(
     """
 
     try:
-        logging.info(f"Validating ro-crate metadata with profile {profile_name}")
+        logger.info("Validating ro-crate metadata with profile %s", profile_name)
 
         settings = services.ValidationSettings(
-            **({"metadata_only": True}),
-            **({"metadata_dict": json.loads(crate_json)}),
-            **({"profile_identifier": profile_name} if profile_name else {}),
-            **({"skip_checks": skip_checks_list} if skip_checks_list else {}),
-            **({"profiles_path": profiles_path} if profiles_path else {}),
+            **validation_settings_kwargs(
+                profile_name, skip_checks_list, profiles_path, metadata_only=True, metadata_dict=crate_metadata
+            )
         )
 
         return services.validate(settings)
 
     except Exception as e:
-        logging.error(f"Unexpected error during validation: {e}")
+        logger.error("Unexpected error during validation: %s", e)
         return str(e)
 
 
@@ -258,7 +319,7 @@ def check_ro_crate_exists(
     :return: Boolean indicating existence
     """
 
-    logging.info(f"Checking for existence of RO-Crate {crate_id}")
+    logger.info("Checking for existence of RO-Crate %s", crate_id)
 
     if find_rocrate_object_on_minio(crate_id, minio_client, bucket_name, root_path):
         return True
@@ -282,7 +343,7 @@ def check_validation_exists(
     :return: Boolean indicating existence
     """
 
-    logging.info(f"Checking for existence of RO-Crate {crate_id}")
+    logger.info("Checking for existence of RO-Crate %s", crate_id)
 
     if find_validation_object_on_minio(crate_id, minio_client, bucket_name, root_path):
         return True
@@ -290,6 +351,31 @@ def check_validation_exists(
         return False
 
 
+def check_ro_crate_and_validation_exist(
+    minio_client: object,
+    bucket_name: str,
+    crate_id: str,
+    root_path: str,
+) -> tuple[bool, bool]:
+    """
+    Checks for the existence of an RO-Crate and of its validation result, with a single MinIO request.
+
+    :param minio_client: The MinIO client
+    :param bucket_name: The MinIO bucket containing the RO-Crate.
+    :param crate_id: The ID of the RO-Crate to validate.
+    :param root_path: The root path containing the RO-Crate.
+    :return: Booleans indicating existence of the RO-Crate and of the validation result
+    """
+
+    logger.info("Checking for existence of RO-Crate %s and its validation result", crate_id)
+
+    rocrate_object, validation_exists = find_rocrate_and_validation_on_minio(
+        crate_id, minio_client, bucket_name, root_path
+    )
+
+    return bool(rocrate_object), validation_exists
+
+
 def return_ro_crate_validation(
     minio_client: object,
     bucket_name: str,
@@ -304,7 +390,7 @@ def return_ro_crate_validation(
     :return: The validation result
     """
 
-    logging.info(f"Fetching validation result for RO-Crate {crate_id}")
+    logger.info("Fetching validation result for RO-Crate %s", crate_id)
 
     return get_validation_status_from_minio(
         minio_client, bucket_name, crate_id, root_path
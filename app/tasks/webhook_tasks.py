@@ -0,0 +1,42 @@
+"""Tasks for delivering webhook notifications."""
+
+# Author: Alexander Hambley
+# License: MIT
+# Copyright (c) 2025 eScience Lab, The University of Manchester
+
+import logging
+from typing import Any
+
+import requests
+
+from app.celery_worker import celery
+from app.utils.webhook_utils import send_webhook_notification
+
+logger = logging.getLogger(__name__)
+
+# Delivery attempts after the first one, with exponential backoff between them:
+WEBHOOK_MAX_RETRIES = 5
+
+
+@celery.task(
+    bind=True,
+    ignore_result=True,
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=True,
+    max_retries=WEBHOOK_MAX_RETRIES,
+)
+def deliver_webhook_notification(self, url: str, data: Any) -> None:
+    """
+    Background task to send a webhook notification, so validation workers do not wait on the webhook.
+
+    Failed deliveries are retried with exponential backoff.
+
+    :param url: The URL to send the webhook notification to.
+    :param data: The data to send in the POST request.
+    :raises requests.RequestException: If the notification could not be sent after all retries.
+    """
+
+    if self.request.retries:
+        logger.info("Retrying webhook notification to %s (attempt %s)", url, self.request.retries + 1)
+
+    send_webhook_notification(url, data)
@@ -6,8 +6,16 @@
 
 import os
 
+import orjson
 from celery import Celery
 from flask import Flask
+from kombu.serialization import register
+from kombu.utils.json import JSONEncoder, dumps as kombu_dumps, loads as kombu_loads
+
+# Name of the Celery serializer for task messages and results:
+CELERY_SERIALIZER = "orjson"
+
+_kombu_default = JSONEncoder().default
 
 
 def get_env(name: str, default=None, required=False):
@@ -24,9 +32,41 @@ class Config:
     CELERY_BROKER_URL = get_env("CELERY_BROKER_URL", required=False)
     CELERY_RESULT_BACKEND = get_env("CELERY_RESULT_BACKEND", required=False)
 
+    # Celery worker tuning. Validation tasks are long-running, so each worker only reserves
+    # one task at a time and acknowledges it after completion:
+    CELERY_WORKER_PREFETCH_MULTIPLIER = int(get_env("CELERY_WORKER_PREFETCH_MULTIPLIER", 1))
+    CELERY_TASK_ACKS_LATE = get_env("CELERY_TASK_ACKS_LATE", "true").lower() == "true"
+    CELERY_BROKER_POOL_LIMIT = int(get_env("CELERY_BROKER_POOL_LIMIT", 50))
+    # Stored results are only needed until a client has collected a metadata validation:
+    CELERY_RESULT_EXPIRES = int(get_env("CELERY_RESULT_EXPIRES", 3600))
+    # Whole-crate validations and metadata-only validations run on separate queues, so that a
+    # metadata validation a client is waiting on does not sit behind crate downloads:
+    CELERY_VALIDATION_QUEUE = get_env("CELERY_VALIDATION_QUEUE", "validation")
+    CELERY_METADATA_VALIDATION_QUEUE = get_env("CELERY_METADATA_VALIDATION_QUEUE", "metadata_validation")
+    # Webhook notifications are delivered, and retried, separately from the validations:
+    CELERY_WEBHOOK_QUEUE = get_env("CELERY_WEBHOOK_QUEUE", "webhooks")
+
+    # Redis instance used to de-duplicate in-flight validations. Locks expire after
+    # VALIDATION_LOCK_TTL seconds in case a worker dies without releasing one:
+    REDIS_URL = get_env("REDIS_URL", required=False)
+    VALIDATION_LOCK_TTL = int(get_env("VALIDATION_LOCK_TTL", 3600))
+
     # rocrate validator configuration:
     PROFILES_PATH = get_env("PROFILES_PATH", required=False)
 
+    # Seconds for which a remote JSON-LD context, e.g. the RO-Crate context, is reused by a worker:
+    JSONLD_CONTEXT_CACHE_TTL = int(get_env("JSONLD_CONTEXT_CACHE_TTL", 86400))
+
+    # Directory in which crates are downloaded for validation, e.g. a tmpfs mount. Defaults to the
+    # system temporary directory:
+    VALIDATION_TEMP_DIR = get_env("VALIDATION_TEMP_DIR", required=False)
+
+    # Seconds to wait for a metadata validation before answering with a task ID instead:
+    METADATA_VALIDATION_TIMEOUT = float(get_env("METADATA_VALIDATION_TIMEOUT", 30))
+
+    # Seconds for which a validation result fetched from MinIO is kept in memory, and served while it is unchanged:
+    VALIDATION_RESULT_CACHE_TTL = int(get_env("VALIDATION_RESULT_CACHE_TTL", 60))
+
 
 class DevelopmentConfig(Config):
     """Development configuration class."""
@@ -42,16 +82,86 @@ class InvalidAPIUsage(Exception):
     status_code = 400
 
     def __init__(self, message, status_code=None, payload=None):
-        super().__init__()
+        super().__init__(message)
         self.message = message
         if status_code is not None:
             self.status_code = status_code
         self.payload = payload
+        # The response body is built once, rather than each time the error is rendered:
+        self._body = dict(payload or ())
+        self._body['message'] = message
 
     def to_dict(self):
-        rv = dict(self.payload or ())
-        rv['message'] = self.message
-        return rv
+        return self._body
+
+
+def orjson_dumps(obj) -> bytes:
+    """
+    Encodes a Celery message body or result as compact JSON using orjson.
+
+    Dates, times and other types orjson does not handle are encoded as Kombu's JSON serializer does, and values
+    orjson cannot represent, such as integers beyond 64 bits, fall back to Kombu's encoder entirely.
+
+    :param obj: The message body or result.
+    :return: The encoded JSON.
+    """
+
+    try:
+        return orjson.dumps(obj, default=_kombu_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except orjson.JSONEncodeError:
+        return kombu_dumps(obj).encode("utf-8")
+
+
+def register_orjson_serializer() -> None:
+    """
+    Registers the orjson serializer with Kombu. Messages are decoded with Kombu's JSON decoder, which restores the
+    types encoded by Kombu, and keeps integers that orjson would parse as floats exact.
+    """
+
+    register(
+        CELERY_SERIALIZER,
+        orjson_dumps,
+        kombu_loads,
+        content_type="application/x-orjson",
+        content_encoding="utf-8",
+    )
+
+
+def configure_celery_worker(celery: Celery, config_cls: type[Config] = Config) -> None:
+    """
+    Applies the worker prefetch, acknowledgement, connection pool, result, serialization and
+    task routing settings to a Celery instance.
+
+    Messages and results are encoded with orjson, which is faster and more compact than the
+    default JSON serializer for large metadata payloads. Plain JSON is still accepted.
+
+    :param celery: The Celery instance to configure.
+    :param config_cls: The configuration class to read the settings from.
+    """
+    register_orjson_serializer()
+
+    celery.conf.update(
+        task_serializer=CELERY_SERIALIZER,
+        result_serializer=CELERY_SERIALIZER,
+        accept_content=[CELERY_SERIALIZER, "json"],
+        result_accept_content=[CELERY_SERIALIZER, "json"],
+        worker_prefetch_multiplier=config_cls.CELERY_WORKER_PREFETCH_MULTIPLIER,
+        task_acks_late=config_cls.CELERY_TASK_ACKS_LATE,
+        task_reject_on_worker_lost=config_cls.CELERY_TASK_ACKS_LATE,
+        broker_pool_limit=config_cls.CELERY_BROKER_POOL_LIMIT,
+        result_expires=config_cls.CELERY_RESULT_EXPIRES,
+        task_routes={
+            "app.tasks.validation_tasks.process_validation_task_by_id": {
+                "queue": config_cls.CELERY_VALIDATION_QUEUE
+            },
+            "app.tasks.validation_tasks.process_validation_task_by_metadata": {
+                "queue": config_cls.CELERY_METADATA_VALIDATION_QUEUE
+            },
+            "app.tasks.webhook_tasks.deliver_webhook_notification": {
+                "queue": config_cls.CELERY_WEBHOOK_QUEUE
+            },
+        },
+    )
 
 
 def make_celery(app: Flask = None) -> Celery:
@@ -69,6 +179,7 @@ def make_celery(app: Flask = None) -> Celery:
         broker=config_cls.CELERY_BROKER_URL,
         backend=config_cls.CELERY_RESULT_BACKEND,
     )
+    configure_celery_worker(celery, config_cls)
 
     if app:
         celery.conf.update(app.config)
@@ -0,0 +1,67 @@
+"""Utility methods for caching the remote JSON-LD contexts referenced by RO-Crate metadata."""
+
+# Author: Alexander Hambley
+# License: MIT
+# Copyright (c) 2025 eScience Lab, The University of Manchester
+
+import logging
+from threading import Lock
+
+from cachetools import TTLCache
+from rdflib.plugins.shared.jsonld import context as jsonld_context
+
+from app.utils.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+_source_to_json = jsonld_context.source_to_json
+
+_jsonld_context_cache = TTLCache(maxsize=256, ttl=Config.JSONLD_CONTEXT_CACHE_TTL)
+_cache_lock = Lock()
+
+
+def fetch_jsonld_context(source_url: str) -> tuple:
+    """
+    Drop-in replacement for the remote context loader of rdflib's JSON-LD parser, which returns recently
+    fetched contexts from memory.
+
+    rdflib only caches contexts for the duration of a single parse, so every RO-Crate validated would
+    otherwise fetch e.g. https://w3id.org/ro/crate/1.1/context again.
+
+    :param source_url: The URL of the JSON-LD context.
+    :return: The parsed context document and its HTML base, as returned by rdflib.
+    """
+
+    if not isinstance(source_url, str) or not source_url.startswith(("http://", "https://")):
+        return _source_to_json(source_url)
+
+    with _cache_lock:
+        cached = _jsonld_context_cache.get(source_url)
+    if cached is not None:
+        return cached
+
+    logger.info("Fetching JSON-LD context %s", source_url)
+    result = _source_to_json(source_url)
+
+    with _cache_lock:
+        _jsonld_context_cache[source_url] = result
+
+    return result
+
+
+def enable_jsonld_context_cache() -> None:
+    """
+    Makes rdflib reuse fetched JSON-LD contexts for the rest of the process.
+    """
+
+    jsonld_context.source_to_json = fetch_jsonld_context
+
+
+def clear_jsonld_context_cache() -> None:
+    """
+    Discards all cached JSON-LD contexts.
+    """
+
+    with _cache_lock:
+        _jsonld_context_cache.clear()
@@ -0,0 +1,99 @@
+"""Utility methods for de-duplicating in-flight validations with Redis locks."""
+
+# Author: Alexander Hambley
+# License: MIT
+# Copyright (c) 2025 eScience Lab, The University of Manchester
+
+import hashlib
+import logging
+
+import redis
+
+from app.utils.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "cratey:lock:"
+
+_redis_client = None
+
+
+def get_redis_client() -> redis.Redis | None:
+    """
+    Returns the Redis client used for validation locks, creating it on first use.
+
+    :return: The Redis client, or None if `REDIS_URL` is not configured.
+    """
+
+    global _redis_client
+
+    if _redis_client is None and Config.REDIS_URL:
+        _redis_client = redis.Redis.from_url(Config.REDIS_URL)
+
+    return _redis_client
+
+
+def validation_lock_key(
+    minio_config: dict, crate_id: str, root_path: str | None, profile_name: str | None, webhook_url: str | None
+) -> str:
+    """
+    Builds the lock key identifying a validation request.
+
+    Requests only share a key if they would run the same validation and notify the same
+    webhook, so that a retried request is de-duplicated but a distinct one is not.
+
+    :param minio_config: Access settings for Minio instance containing the RO-Crate.
+    :param crate_id: The ID of the RO-Crate to validate.
+    :param root_path: The root path containing the RO-Crate.
+    :param profile_name: The profile to validate against.
+    :param webhook_url: The URL to POST the validation results to.
+    :return: The Redis key for the lock.
+    """
+
+    identity = "\x1f".join(
+        str(value) for value in (
+            minio_config["endpoint"], minio_config["bucket"], root_path, crate_id, profile_name, webhook_url
+        )
+    )
+
+    return LOCK_PREFIX + hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def acquire_validation_lock(key: str) -> bool:
+    """
+    Attempts to take the lock for a validation request.
+
+    If Redis is not configured or cannot be reached, the lock is treated as acquired so that
+    validation requests are never refused because of it.
+
+    :param key: The lock key, as built by `validation_lock_key`.
+    :return: True if the lock was acquired, False if the validation is already in progress.
+    """
+
+    client = get_redis_client()
+    if client is None:
+        return True
+
+    try:
+        return bool(client.set(key, 1, nx=True, ex=Config.VALIDATION_LOCK_TTL))
+    except redis.RedisError as e:
+        logger.warning("Unable to acquire validation lock, continuing without it: %s", e)
+        return True
+
+
+def release_validation_lock(key: str) -> None:
+    """
+    Releases the lock for a validation request.
+
+    :param key: The lock key, as built by `validation_lock_key`.
+    """
+
+    client = get_redis_client()
+    if client is None:
+        return
+
+    try:
+        client.delete(key)
+    except redis.RedisError as e:
+        logger.warning("Unable to release validation lock %s: %s", key, e)
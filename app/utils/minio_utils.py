@@ -4,18 +4,86 @@
 # License: MIT
 # Copyright (c) 2025 eScience Lab, The University of Manchester
 
-import json
+import gzip
+import hashlib
 import logging
 import os
+import shutil
 import tempfile
+import threading
 
+import certifi
+import orjson
+import urllib3
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
+from typing import Iterator, Optional
 from minio import Minio, S3Error
-from app.utils.config import InvalidAPIUsage
+from urllib3.util import Retry, Timeout
+from app.utils.config import Config, InvalidAPIUsage
 
 
 logger = logging.getLogger(__name__)
 
+# Number of objects of a directory RO-Crate downloaded concurrently:
+MINIO_DOWNLOAD_WORKERS = 8
+
+# Bytes read from a MinIO download response at a time:
+MINIO_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# RO-Crate objects of at least this size are downloaded as concurrent byte ranges, one per download worker:
+MINIO_RANGED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+
+# Connections kept open per MinIO endpoint, and number of distinct MinIO configurations with a cached client:
+MINIO_CONNECTION_POOL_SIZE = 32
+MINIO_CLIENT_CACHE_SIZE = 16
+
+# User metadata on the validation result, identifying the crate contents and profile it was produced from:
+VALIDATION_FINGERPRINT_METADATA = "crate-fingerprint"
+
+# Validation results are stored gzip-compressed, with a Content-Encoding header so that HTTP clients, including the
+# MinIO client, decompress them transparently:
+VALIDATION_STATUS_COMPRESSION_LEVEL = 6
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Directory owned by the current worker process, in which each task's RO-Crate download directory is created. It is
+# created by the first download, so that it belongs to the process running the tasks whichever pool is used:
+_worker_scratch_dir: Optional[str] = None
+_worker_scratch_dir_lock = threading.Lock()
+
+
+def get_worker_scratch_dir() -> str:
+    """
+    Returns the directory that this process downloads RO-Crates into, creating it inside the configured temporary
+    directory on first use.
+
+    :return: The path to the scratch directory.
+    """
+
+    global _worker_scratch_dir
+
+    with _worker_scratch_dir_lock:
+        if not _worker_scratch_dir:
+            _worker_scratch_dir = tempfile.mkdtemp(prefix="cratey-", dir=Config.VALIDATION_TEMP_DIR)
+            logger.info("Downloading RO-Crates into scratch directory %s", _worker_scratch_dir)
+
+        return _worker_scratch_dir
+
+
+def remove_worker_scratch_dir() -> None:
+    """
+    Removes this process's scratch directory, along with any downloads a failed task did not clean up.
+    """
+
+    global _worker_scratch_dir
+
+    with _worker_scratch_dir_lock:
+        if _worker_scratch_dir:
+            shutil.rmtree(_worker_scratch_dir, ignore_errors=True)
+            _worker_scratch_dir = None
+
 
 def fetch_ro_crate_from_minio(minio_client: object, minio_bucket: str, crate_id: str, root_path: str) -> str:
     """
@@ -25,87 +93,150 @@ def fetch_ro_crate_from_minio(minio_client: object, minio_bucket: str, crate_id:
     :param minio_bucket: The MinIO bucket containing the RO-Crate.
     :param crate_id: The ID of the RO-Crate to fetch from MinIO.
     :param root_path: The root path containing the RO-Crate.
-    :return: The local file path where the RO-Crate is saved.
+    :return: The local file path where the RO-Crate is saved, inside a new temporary directory.
+    :raises InvalidAPIUsage: If the RO-Crate does not exist, 400, or could not be downloaded. The temporary directory
+        is removed before the error is raised.
     """
 
     rocrate_object = find_rocrate_object_on_minio(crate_id, minio_client, minio_bucket, root_path)
+    if not rocrate_object:
+        raise InvalidAPIUsage(f"No RO-Crate with prefix: {crate_id}", 400)
 
     rocrate_minio_path = rocrate_object.object_name
     rocrate_name = rocrate_minio_path.split('/')[-1]
 
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = tempfile.mkdtemp(dir=get_worker_scratch_dir())
     local_root_path = os.path.join(temp_dir, rocrate_name)
 
-    logging.info(
-        f"Fetching RO-Crate {rocrate_name} from MinIO bucket {minio_bucket}. File path {local_root_path}"
+    logger.info(
+        "Fetching RO-Crate %s from MinIO bucket %s. File path %s", rocrate_name, minio_bucket, local_root_path
     )
 
-    if rocrate_object.is_dir:
-        os.makedirs(os.path.dirname(local_root_path), exist_ok=True)
-
-        objects_list = get_minio_object_list(rocrate_minio_path, minio_client, minio_bucket, recursive=True)
-        for obj in objects_list:
-            relative_path = obj.object_name[len(rocrate_minio_path):].lstrip("/")
-            local_file_path = os.path.join(local_root_path, relative_path)
-            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-            download_file_from_minio(minio_client, minio_bucket, obj.object_name, local_file_path)
-
-    else:
-        file_path = local_root_path
-        download_file_from_minio(minio_client, minio_bucket, rocrate_minio_path, file_path)
-
-    logging.info(
-        f"RO-Crate {rocrate_name} fetched successfully and saved to {local_root_path}."
+    # The caller only removes the directory once it has the returned path, so remove it here if a download fails:
+    try:
+        if rocrate_object.is_dir:
+            os.makedirs(os.path.dirname(local_root_path), exist_ok=True)
+
+            objects_list = get_minio_object_list(rocrate_minio_path, minio_client, minio_bucket, recursive=True)
+            downloads = []
+            local_dirs = set()
+            # Object names start with the crate's path and a separator:
+            prefix_length = len(rocrate_minio_path.rstrip("/")) + 1
+            for obj in objects_list:
+                local_file_path = f"{local_root_path}/{obj.object_name[prefix_length:]}"
+                local_dirs.add(os.path.dirname(local_file_path))
+                downloads.append((obj.object_name, local_file_path))
+
+            # Create each directory once, rather than once for every object in it:
+            for local_dir in local_dirs:
+                os.makedirs(local_dir, exist_ok=True)
+
+            # Objects are independent, so they are fetched concurrently; result() re-raises any
+            # download error:
+            with ThreadPoolExecutor(max_workers=MINIO_DOWNLOAD_WORKERS) as executor:
+                futures = [
+                    executor.submit(download_file_from_minio, minio_client, minio_bucket, object_name, local_file_path)
+                    for object_name, local_file_path in downloads
+                ]
+                for future in futures:
+                    future.result()
+
+        elif (rocrate_object.size or 0) >= MINIO_RANGED_DOWNLOAD_THRESHOLD:
+            download_file_in_ranges_from_minio(
+                minio_client, minio_bucket, rocrate_minio_path, local_root_path, rocrate_object.size
+            )
+
+        else:
+            file_path = local_root_path
+            download_file_from_minio(minio_client, minio_bucket, rocrate_minio_path, file_path)
+
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    logger.info(
+        "RO-Crate %s fetched successfully and saved to %s.", rocrate_name, local_root_path
     )
 
     return local_root_path
 
 
-def update_validation_status_in_minio(minio_client: object, minio_bucket: str, crate_id: str, root_path: str, validation_status: str) -> None:
+def validation_status_object_name(crate_id: str, root_path: str | None) -> str:
+    """
+    Returns the name of the MinIO object holding the validation result for an RO-Crate:
+    `<root_path>/<crate_id>_validation/validation_status.txt`.
+
+    :param crate_id: The ID of the RO-Crate in MinIO
+    :param root_path: The root path containing the RO-Crate.
+    :return: The object name
+    """
+
+    if root_path:
+        return f"{root_path}/{crate_id}_validation/validation_status.txt"
+    return f"{crate_id}_validation/validation_status.txt"
+
+
+def update_validation_status_in_minio(
+    minio_client: object,
+    minio_bucket: str,
+    crate_id: str,
+    root_path: str,
+    validation_status: str | bytes,
+    fingerprint: str | None = None,
+) -> None:
     """
     Uploads the validation status to the MinIO bucket.
 
     :param minio_client: The MinIO client
     :param minio_bucket: The MinIO bucket containing the RO-Crate.
     :param crate_id: The ID of the RO-Crate in MinIO
-    :param validation_status: The validation result to upload
+    :param validation_status: The validation result to upload, as a JSON string or UTF-8 encoded bytes. It is stored
+        gzip-compressed.
+    :param fingerprint: The fingerprint of the validated RO-Crate, stored with the result. Defaults to None.
     :raises S3Error: If an error occurs during the MinIO operation
     :raises ValueError: If the required environment variables are not set
     :raises Exception: If an unexpected error occurs
     """
 
-    # The object in MinIO is <crate_id>_validation/validation_status.txt
-    if root_path:
-        object_name = f"{root_path}/{crate_id}_validation/validation_status.txt"
+    object_name = validation_status_object_name(crate_id, root_path)
+
+    if isinstance(validation_status, str):
+        validation_string = validation_status.encode("utf-8")
     else:
-        object_name = f"{crate_id}_validation/validation_status.txt"
+        validation_string = validation_status
+
+    compressed_status = gzip.compress(
+        validation_string, compresslevel=VALIDATION_STATUS_COMPRESSION_LEVEL, mtime=0
+    )
 
-    # convert pretty string to dictionary, then back to plain utf-8 encoded string
-    validation_string = json.dumps(json.loads(validation_status), indent=None).encode("utf-8")
+    metadata = {"Content-Encoding": "gzip"}
+    if fingerprint:
+        metadata[VALIDATION_FINGERPRINT_METADATA] = fingerprint
 
     try:
         minio_client.put_object(
             minio_bucket,
             object_name,
-            data=BytesIO(validation_string),
-            length=len(validation_string),
+            data=BytesIO(compressed_status),
+            length=len(compressed_status),
             content_type="application/json",
+            metadata=metadata,
         )
 
     except S3Error as s3_error:
-        logging.error(f"MinIO S3 Error: {s3_error}")
+        logger.error("MinIO S3 Error: %s", s3_error)
         raise InvalidAPIUsage(f"MinIO S3 Error: {s3_error}", 500)
 
     except ValueError as value_error:
-        logging.error(f"Configuration Error: {value_error}")
+        logger.error("Configuration Error: %s", value_error)
         raise InvalidAPIUsage(f"Configuration Error: {value_error}", 500)
 
     except Exception as e:
-        logging.error(f"Unexpected error updating validation status in MinIO: {e}")
+        logger.error("Unexpected error updating validation status in MinIO: %s", e)
         raise InvalidAPIUsage(f"Unknown Error: {e}", 500)
 
-    logging.info(
-        f"Validation status file uploaded to {minio_bucket}/{object_name} successfully."
+    logger.info(
+        "Validation status file uploaded to %s/%s successfully.", minio_bucket, object_name
     )
 
 
@@ -121,13 +252,11 @@ def get_validation_status_from_minio(minio_client: object, minio_bucket: str, cr
 
     """
 
-    # The object in MinIO is <crate_id>_validation/validation_status.txt
-    if root_path:
-        object_name = f"{root_path}/{crate_id}_validation/validation_status.txt"
-    else:
-        object_name = f"{crate_id}_validation/validation_status.txt"
+    object_name = validation_status_object_name(crate_id, root_path)
+
+    logger.info("Getting object %s", object_name)
 
-    logging.info(f"Getting object {object_name}")
+    response = None
 
     try:
         response = minio_client.get_object(
@@ -135,54 +264,216 @@ def get_validation_status_from_minio(minio_client: object, minio_bucket: str, cr
             object_name,
         )
 
-        validation_message = json.loads(response.data.decode())
-        response.close()
-        response.release_conn()
+        # The client decompresses results stored with a gzip Content-Encoding, but a result may still arrive
+        # compressed if that header was lost, e.g. when it was copied between buckets:
+        validation_data = response.read()
+        if validation_data.startswith(_GZIP_MAGIC):
+            validation_data = gzip.decompress(validation_data)
+
+        # orjson parses the UTF-8 response body directly, without decoding it to a str first:
+        validation_message = orjson.loads(validation_data)
 
     except S3Error as s3_error:
-        logging.error(f"MinIO S3 Error: {s3_error}")
+        if s3_error.code == "NoSuchKey":
+            logger.error("No validation result yet for RO-Crate: %s", crate_id)
+            raise InvalidAPIUsage(f"No validation result yet for RO-Crate: {crate_id}", 400)
+        logger.error("MinIO S3 Error: %s", s3_error)
         raise InvalidAPIUsage(f"MinIO S3 Error: {s3_error}", 500)
 
     except ValueError as value_error:
-        logging.error(f"Configuration Error: {value_error}")
+        logger.error("Configuration Error: %s", value_error)
         raise InvalidAPIUsage(f"Configuration Error: {value_error}", 500)
 
     except Exception as e:
-        logging.error(f"Unexpected error retrieving validation status from MinIO: {e}")
+        logger.error("Unexpected error retrieving validation status from MinIO: %s", e)
         raise InvalidAPIUsage(f"Unknown Error: {e}", 500)
 
     else:
         return validation_message
 
+    finally:
+        # Always hand the connection back to the pool, including when parsing fails:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+
+def get_ro_crate_fingerprint(minio_client: object, minio_bucket: str, crate_id: str, root_path: str,
+                             profile_name: str | None, validator_fingerprint: str = "") -> str | None:
+    """
+    Computes a fingerprint of an RO-Crate's contents on MinIO and the profile it is validated against.
+
+    The fingerprint is built from the object ETags, so the RO-Crate itself is not downloaded.
+
+    :param minio_client: The MinIO client
+    :param minio_bucket: The MinIO bucket containing the RO-Crate.
+    :param crate_id: The ID of the RO-Crate in MinIO
+    :param root_path: The root path containing the RO-Crate.
+    :param profile_name: The name of the validation profile.
+    :param validator_fingerprint: A fingerprint of the validator and profiles used, from `profiles_fingerprint`, so
+        that a stored result is not reused after either changes. Defaults to "".
+    :return: The fingerprint, or None if it cannot be computed
+    """
+
+    try:
+        rocrate_object = find_rocrate_object_on_minio(crate_id, minio_client, minio_bucket, root_path)
+        if not rocrate_object:
+            return None
+
+        if rocrate_object.is_dir:
+            objects_list = get_minio_object_list(
+                rocrate_object.object_name, minio_client, minio_bucket, recursive=True
+            )
+        else:
+            objects_list = [rocrate_object]
+
+    except InvalidAPIUsage as e:
+        logger.warning("Could not compute fingerprint of RO-Crate %s: %s", crate_id, e.message)
+        return None
+
+    fingerprint = hashlib.sha256(f"{validator_fingerprint}\n{profile_name or ''}".encode("utf-8"))
+    for obj in sorted(objects_list, key=lambda obj: obj.object_name):
+        fingerprint.update(f"\n{obj.object_name}\t{obj.etag}".encode("utf-8"))
+
+    return fingerprint.hexdigest()
 
-def download_file_from_minio(minio_client: object, minio_bucket: str, object_path: str, file_path: str) -> None:
+
+def get_cached_validation_status(minio_client: object, minio_bucket: str, crate_id: str, root_path: str,
+                                 fingerprint: str | None) -> dict | None:
+    """
+    Returns the stored validation result for an RO-Crate, if it was produced from the same contents and profile.
+
+    :param minio_client: The MinIO client
+    :param minio_bucket: The MinIO bucket containing the RO-Crate.
+    :param crate_id: The ID of the RO-Crate in MinIO
+    :param root_path: The root path containing the RO-Crate.
+    :param fingerprint: The fingerprint of the RO-Crate, from `get_ro_crate_fingerprint`.
+    :return: The validation result, or None if there is no matching result
     """
-    Downloads a file from MinIO
+
+    if not fingerprint:
+        return None
+
+    object_name = validation_status_object_name(crate_id, root_path)
+
+    try:
+        stat = minio_client.stat_object(minio_bucket, object_name)
+    except S3Error as s3_error:
+        if s3_error.code != "NoSuchKey":
+            logger.warning("MinIO S3 Error: %s", s3_error)
+        return None
+
+    if stat.metadata.get(f"x-amz-meta-{VALIDATION_FINGERPRINT_METADATA}") != fingerprint:
+        return None
+
+    try:
+        return get_validation_status_from_minio(minio_client, minio_bucket, crate_id, root_path)
+    except InvalidAPIUsage:
+        return None
+
+
+def get_validation_status_etag(minio_client: object, minio_bucket: str, crate_id: str, root_path: str) -> str | None:
+    """
+    Returns the ETag of the stored validation result for an RO-Crate, which changes whenever the result is replaced.
+
+    :param minio_client: The MinIO client
+    :param minio_bucket: The MinIO bucket containing the RO-Crate.
+    :param crate_id: The ID of the RO-Crate in MinIO
+    :param root_path: The root path containing the RO-Crate.
+    :return: The ETag, or None if there is no validation result or it could not be checked
+    """
+
+    object_name = validation_status_object_name(crate_id, root_path)
+
+    try:
+        return minio_client.stat_object(minio_bucket, object_name).etag
+    except S3Error as s3_error:
+        if s3_error.code != "NoSuchKey":
+            logger.warning("MinIO S3 Error: %s", s3_error)
+        return None
+
+
+def download_file_from_minio(
+    minio_client: object,
+    minio_bucket: str,
+    object_path: str,
+    file_path: str,
+    offset: int = 0,
+    length: int = 0,
+) -> None:
+    """
+    Downloads a file from MinIO, or a byte range of it into the same position of an existing local file.
 
     :param minio_client: MinIO object
     :param minio_bucket: name of MinIO bucket, string
     :param object_path: path to object on MinIO, string
     :param file_path: local path, string
+    :param offset: start of the byte range to download. Defaults to 0.
+    :param length: number of bytes to download from the offset. Defaults to 0, for the whole object.
     :raises S3Error: If an error occurs during the MinIO operation
     :raises ValueError: If the required environment variables are not set
     :raises Exception: If an unexpected error occurs
     """
 
+    # Streams a single GET into the file, as fget_object would also send a stat_object request first and download
+    # into a separate part file, neither of which are needed inside the task's own temporary directory:
+    response = None
     try:
-        minio_client.fget_object(minio_bucket, object_path, file_path)
+        response = minio_client.get_object(minio_bucket, object_path, offset=offset, length=length)
+        with open(file_path, "r+b" if length else "wb") as local_file:
+            local_file.seek(offset)
+            for data in response.stream(amt=MINIO_DOWNLOAD_CHUNK_SIZE):
+                local_file.write(data)
 
     except S3Error as s3_error:
-        logging.error(f"MinIO S3 Error: {s3_error}")
+        logger.error("MinIO S3 Error: %s", s3_error)
         raise InvalidAPIUsage(f"MinIO S3 Error: {s3_error}", 500)
 
     except ValueError as value_error:
-        logging.error(f"Configuration Error: {value_error}")
+        logger.error("Configuration Error: %s", value_error)
         raise InvalidAPIUsage(f"Configuration Error: {value_error}", 500)
 
     except Exception as e:
-        logging.error(f"Unexpected error retrieving file from MinIO: {e}")
+        logger.error("Unexpected error retrieving file from MinIO: %s", e)
         raise InvalidAPIUsage(f"Unknown Error: {e}", 500)
 
+    finally:
+        if response:
+            response.close()
+            response.release_conn()
+
+
+def download_file_in_ranges_from_minio(
+    minio_client: object, minio_bucket: str, object_path: str, file_path: str, size: int
+) -> None:
+    """
+    Downloads a large file from MinIO as concurrent byte ranges, each over its own connection.
+
+    :param minio_client: MinIO object
+    :param minio_bucket: name of MinIO bucket, string
+    :param object_path: path to object on MinIO, string
+    :param file_path: local path, string
+    :param size: size of the object in bytes
+    :raises InvalidAPIUsage: If downloading any of the ranges fails, 500
+    """
+
+    range_size = -(-size // MINIO_DOWNLOAD_WORKERS)
+
+    # Allocate the whole file, so that each range can be written in place:
+    with open(file_path, "wb") as local_file:
+        local_file.truncate(size)
+
+    with ThreadPoolExecutor(max_workers=MINIO_DOWNLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                download_file_from_minio,
+                minio_client, minio_bucket, object_path, file_path, offset, min(range_size, size - offset)
+            )
+            for offset in range(0, size, range_size)
+        ]
+        for future in futures:
+            future.result()
+
 
 def find_validation_object_on_minio(rocrate_id: str, minio_client, minio_bucket: str, root_path: str) -> object:
     """
@@ -199,14 +490,11 @@ def find_validation_object_on_minio(rocrate_id: str, minio_client, minio_bucket:
     :raise Exception: If validation result can't be found, 400
     """
 
-    logging.info(f"Finding Validation result: {rocrate_id}_validation/validation_status.txt")
+    logger.info("Finding Validation result: %s_validation/validation_status.txt", rocrate_id)
 
-    if root_path:
-        file_path = f"{root_path}/{rocrate_id}_validation/validation_status.txt"
-    else:
-        file_path = f"{rocrate_id}_validation/validation_status.txt"
+    file_path = validation_status_object_name(rocrate_id, root_path)
 
-    file_list = get_minio_object_list(file_path, minio_client, minio_bucket)
+    file_list = iter_minio_objects(file_path, minio_client, minio_bucket)
 
     return_object = False
     for obj in file_list:
@@ -215,7 +503,7 @@ def find_validation_object_on_minio(rocrate_id: str, minio_client, minio_bucket:
             break
 
     if not return_object:
-        logging.error(f"No validation result yet for RO-Crate: {rocrate_id}")
+        logger.error("No validation result yet for RO-Crate: %s", rocrate_id)
         return False
     else:
         return return_object
@@ -236,14 +524,14 @@ def find_rocrate_object_on_minio(rocrate_id: str, minio_client, minio_bucket: st
     :raise Exception: If RO-Crate can't be found, 400
     """
 
-    logging.info(f"Finding RO-Crate: {rocrate_id}")
+    logger.info("Finding RO-Crate: %s", rocrate_id)
 
     if root_path:
         rocrate_path = f"{root_path}/{rocrate_id}"
     else:
         rocrate_path = rocrate_id
 
-    rocrate_list = get_minio_object_list(rocrate_path, minio_client, minio_bucket)
+    rocrate_list = iter_minio_objects(rocrate_path, minio_client, minio_bucket)
 
     return_object = False
     for obj in rocrate_list:
@@ -253,56 +541,111 @@ def find_rocrate_object_on_minio(rocrate_id: str, minio_client, minio_bucket: st
             break
 
     if not return_object:
-        logging.error(f"No RO-Crate with prefix: {rocrate_path}")
+        logger.error("No RO-Crate with prefix: %s", rocrate_path)
         return False
     else:
         return return_object
 
 
-def get_minio_object_list(object_path: str, minio_client, minio_bucket: str, recursive: bool = False) -> list:
+def find_rocrate_and_validation_on_minio(rocrate_id: str, minio_client, minio_bucket: str,
+                                         root_path: str) -> tuple[object | bool, bool]:
     """
-    Creates a list of objects which match the object_id and path_prefix
+    Checks for the requested RO-Crate and for a validation result for it, with a single MinIO listing.
+
+    The RO-Crate, and the `<rocrate_id>_validation/` directory holding its validation result, share the
+    `<root_path>/<rocrate_id>` prefix, so one non-recursive listing of that prefix finds both.
+
+    :param rocrate_id: string containing the name of ro-crate
+    :param minio_client: minio object
+    :param minio_bucket: string containing bucket on minio
+    :param root_path: string containing the path within which the ro-crate should be
+    :return: The rocrate object or False, and whether a validation result directory exists
+    """
+
+    logger.info("Finding RO-Crate and validation result: %s", rocrate_id)
+
+    if root_path:
+        rocrate_path = f"{root_path}/{rocrate_id}"
+    else:
+        rocrate_path = rocrate_id
+
+    rocrate_object = False
+    validation_exists = False
+    for obj in iter_minio_objects(rocrate_path, minio_client, minio_bucket):
+        if (obj.object_name == f"{rocrate_path}/" and obj.is_dir) or obj.object_name == f"{rocrate_path}.zip":
+            rocrate_object = obj
+        elif obj.object_name == f"{rocrate_path}_validation/" and obj.is_dir:
+            validation_exists = True
+
+        if rocrate_object and validation_exists:
+            break
+
+    return rocrate_object, validation_exists
+
+
+def iter_minio_objects(object_path: str, minio_client, minio_bucket: str, recursive: bool = False) -> Iterator:
+    """
+    Lazily lists the objects which match the object path. Further pages of the listing are only requested as the
+    objects are consumed, so a caller which stops at the first match does not fetch the rest of the listing.
 
     :param object_path: The object ID, string
-    :param path_prefix: Path prefix, string, optional
     :param minio_client: MinIO client object
     :param minio_bucket: string
     :param recursive: boolean, default = False
-    :return object_list: List containing objects of type minio.datatypes.Object
+    :return: Iterator over objects of type minio.datatypes.Object
     :raises S3Error: If an error occurs during the MinIO operation, 500
     :raises ValueError: If the required environment variables are not set, 500
     :raises Exception: If an unexpected error occurs, 500
     """
 
+    response = None
     try:
         response = minio_client.list_objects(
             minio_bucket,
             object_path,
             recursive=recursive
         )
-        object_list = [obj for obj in response]
-
-        response.close()
+        yield from response
 
     except S3Error as s3_error:
-        logging.error(f"MinIO S3 Error: {s3_error}")
+        logger.error("MinIO S3 Error: %s", s3_error)
         raise InvalidAPIUsage(f"MinIO S3 Error: {s3_error}", 500)
 
     except ValueError as value_error:
-        logging.error(f"Configuration Error: {value_error}")
+        logger.error("Configuration Error: %s", value_error)
         raise InvalidAPIUsage(f"Configuration Error: {value_error}", 500)
 
     except Exception as e:
-        logging.error(f"Unexpected error getting object list from MinIO: {e}")
+        logger.error("Unexpected error getting object list from MinIO: %s", e)
         raise InvalidAPIUsage(f"Unknown Error: {e}", 500)
 
-    else:
-        return object_list
+    finally:
+        if response is not None:
+            response.close()
+
+
+def get_minio_object_list(object_path: str, minio_client, minio_bucket: str, recursive: bool = False) -> list:
+    """
+    Creates a list of objects which match the object_id and path_prefix
+
+    :param object_path: The object ID, string
+    :param minio_client: MinIO client object
+    :param minio_bucket: string
+    :param recursive: boolean, default = False
+    :return object_list: List containing objects of type minio.datatypes.Object
+    :raises S3Error: If an error occurs during the MinIO operation, 500
+    :raises ValueError: If the required environment variables are not set, 500
+    :raises Exception: If an unexpected error occurs, 500
+    """
+
+    return list(iter_minio_objects(object_path, minio_client, minio_bucket, recursive=recursive))
 
 
 def get_minio_client(minio_config: dict) -> Minio:
     """
-    Initialises the MinIO client from provided settings.
+    Returns the MinIO client for the provided settings.
+
+    Clients are created once per process and settings, so their connections are kept alive between calls.
 
     :param minio_config: A dictionary containing the below parameters
     :param endpoint: A string containing host and port. E.g. 'localhost:9000'
@@ -313,11 +656,36 @@ def get_minio_client(minio_config: dict) -> Minio:
     :raises ValueError: If required environment variables are not set.
     """
 
+    return _create_minio_client(
+        minio_config["endpoint"],
+        minio_config["accesskey"],
+        minio_config["secret"],
+        minio_config["ssl"],
+    )
+
+
+@lru_cache(maxsize=MINIO_CLIENT_CACHE_SIZE)
+def _create_minio_client(endpoint: str, access_key: str, secret_key: str, secure: bool) -> Minio:
+    """
+    Initialises a MinIO client with a connection pool large enough for concurrent downloads.
+    """
+
+    # Same settings as the MinIO default, but with a larger pool:
+    timeout = 300
+    http_client = urllib3.PoolManager(
+        timeout=Timeout(connect=timeout, read=timeout),
+        maxsize=MINIO_CONNECTION_POOL_SIZE,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+
     minio_client = Minio(
-        endpoint=minio_config["endpoint"],
-        access_key=minio_config["accesskey"],
-        secret_key=minio_config["secret"],
-        secure=minio_config["ssl"],
+        endpoint=endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=secure,
+        http_client=http_client,
     )
 
     return minio_client
@@ -0,0 +1,152 @@
+"""Utility methods for reusing loaded validation profiles across Celery tasks."""
+
+# Author: Alexander Hambley
+# License: MIT
+# Copyright (c) 2025 eScience Lab, The University of Manchester
+
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from rocrate_validator import __version__ as rocrate_validator_version
+from rocrate_validator.models import Profile, Severity
+from rocrate_validator.services import DEFAULT_PROFILES_PATH
+
+
+logger = logging.getLogger(__name__)
+
+# Each entry holds every profile with its parsed SHACL shapes (around 5MB):
+PROFILE_CACHE_SIZE = 8
+
+# Base URIs the profiles are loaded against more than once: none, and that of every metadata-only crate. By-ID crates
+# are loaded against their own download directory, so caching their profiles would only evict the reusable entries:
+CACHED_PUBLIC_IDS = (None, "file://./")
+
+_load_profiles = Profile.load_profiles.__func__
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _load_profiles_cached(
+    profiles_path: str,
+    extra_profiles_path: Optional[str],
+    public_id: Optional[str],
+    severity: Severity,
+    allow_requirement_check_override: bool,
+) -> tuple[Profile, ...]:
+    """
+    Loads the profiles and parses their requirements, so the SHACL shapes are kept with the cached profiles.
+    """
+
+    logger.info("Loading validation profiles from %s", profiles_path)
+
+    profiles = _load_profiles(
+        Profile,
+        profiles_path,
+        extra_profiles_path=extra_profiles_path,
+        publicID=public_id,
+        severity=severity,
+        allow_requirement_check_override=allow_requirement_check_override,
+    )
+    for profile in profiles:
+        profile.get_requirements()
+
+    return tuple(profiles)
+
+
+def load_profiles(
+    cls: type[Profile],
+    profiles_path,
+    extra_profiles_path=None,
+    publicID: Optional[str] = None,
+    severity: Severity = Severity.REQUIRED,
+    allow_requirement_check_override: bool = True,
+) -> list[Profile]:
+    """
+    Drop-in replacement for `Profile.load_profiles` which returns the profiles loaded by an earlier call.
+
+    Only profiles loaded against a base URI in `CACHED_PUBLIC_IDS` are cached. Any other call is passed straight to
+    `Profile.load_profiles`.
+
+    rocrate_validator looks the target profile up in a class-level registry rather than in the returned list,
+    so the cached profiles are registered again before they are returned.
+
+    :param cls: The Profile class.
+    :param profiles_path: The path to the profiles definition directory.
+    :param extra_profiles_path: An additional path to search for profiles. Defaults to None.
+    :param publicID: The base URI the profile shapes are parsed against. Defaults to None.
+    :param severity: The minimum severity of the loaded requirements. Defaults to REQUIRED.
+    :param allow_requirement_check_override: Whether profile extensions may override checks. Defaults to True.
+    :return: The loaded profiles.
+    """
+
+    if publicID not in CACHED_PUBLIC_IDS:
+        return _load_profiles(
+            cls,
+            profiles_path,
+            extra_profiles_path=extra_profiles_path,
+            publicID=publicID,
+            severity=severity,
+            allow_requirement_check_override=allow_requirement_check_override,
+        )
+
+    profiles = _load_profiles_cached(
+        str(Path(profiles_path)),
+        str(Path(extra_profiles_path)) if extra_profiles_path else None,
+        publicID,
+        severity,
+        allow_requirement_check_override,
+    )
+
+    profiles_map = Profile._Profile__profiles_map
+    for profile in profiles:
+        profiles_map.add(profile.uri, profile)
+
+    return list(profiles)
+
+
+def enable_profile_cache() -> None:
+    """
+    Makes rocrate_validator reuse loaded profiles for the rest of the process.
+
+    Without this, every validation re-reads the profile specifications and re-parses their SHACL shapes.
+    """
+
+    Profile.load_profiles = classmethod(load_profiles)
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _profiles_fingerprint_cached(profiles_path: str) -> str:
+    fingerprint = hashlib.sha256(f"{rocrate_validator_version}\n{profiles_path}".encode("utf-8"))
+    for path in sorted(Path(profiles_path).rglob("*")):
+        if path.is_file():
+            fingerprint.update(f"\n{path.relative_to(profiles_path)}\t".encode("utf-8"))
+            fingerprint.update(path.read_bytes())
+
+    return fingerprint.hexdigest()
+
+
+def profiles_fingerprint(profiles_path: Optional[str] = None) -> str:
+    """
+    Computes a fingerprint of what a validation is run with: the rocrate_validator version, the profiles path and the
+    contents of every file of the profiles, including their SHACL shapes.
+
+    Like the loaded profiles, the fingerprint of a path is computed once per process, so changes to the profile files
+    are picked up when the worker restarts.
+
+    :param profiles_path: The path to the profiles definition directory. Defaults to None, for the validator's
+        built-in profiles.
+    :return: The fingerprint.
+    """
+
+    return _profiles_fingerprint_cached(str(Path(profiles_path or DEFAULT_PROFILES_PATH)))
+
+
+def clear_profile_cache() -> None:
+    """
+    Discards all cached profiles and their fingerprints.
+    """
+
+    _load_profiles_cached.cache_clear()
+    _profiles_fingerprint_cached.cache_clear()
@@ -16,14 +16,14 @@ def send_webhook_notification(url: str, data: Any) -> None:
     """
     Sends a POST request to the specified webhook URL with the given data.
 
+    The data is always encoded as JSON, so a validation report passed as a JSON string is received as a JSON string
+    literal, which receivers decode a second time to get the report.
+
     :param url: The URL to send the webhook notification to.
     :param data: The data to send in the POST request.
     :raises requests.RequestException: If an error occurs when sending the notification.
     """
 
-    try:
-        response = requests.post(url, json=data)
-        response.raise_for_status()
-        logging.info(f"Webhook notification sent successfully to {url}")
-    except requests.RequestException as e:
-        logging.error(f"Failed to send webhook notification: {e}")
+    response = requests.post(url, json=data)
+    response.raise_for_status()
+    logger.info("Webhook notification sent successfully to %s", url)
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
-
 import rocrate_validator.utils.log as logging
 from rocrate_validator.models import Severity, ValidationContext
 from rocrate_validator.requirements.python import PyFunctionCheck, check, requirement
@@ -21,6 +19,13 @@ from rocrate_validator.requirements.python import PyFunctionCheck, check, requir
 # set up logging
 logger = logging.getLogger(__name__)
 
+# RO-Crate 1.2 or later context, i.e. https://w3id.org/ro/crate/1.[2-9](-DRAFT)?/context
+CONTEXT_VERSION_PREFIXES = tuple(
+    f"https://w3id.org/ro/crate/1.{minor}{draft}/context"
+    for minor in range(2, 10)
+    for draft in ("", "-DRAFT")
+)
+
 
 @requirement(name="RO-Crate context version")
 class FileDescriptorContextVersion(PyFunctionCheck):
@@ -36,19 +41,16 @@ class FileDescriptorContextVersion(PyFunctionCheck):
         try:
             json_dict = context.ro_crate.metadata.as_dict()
             context_value = json_dict["@context"]
-            pattern = re.compile(
-                r"https://w3id\.org/ro/crate/1\.[2-9](-DRAFT)?/context"
-            )
             passed = True
             if isinstance(context_value, list):
                 if not any(
-                    pattern.match(item)
+                    item.startswith(CONTEXT_VERSION_PREFIXES)
                     for item in context_value
                     if isinstance(item, str)
                 ):
                     passed = False
             else:
-                if not pattern.match(context_value):
+                if not context_value.startswith(CONTEXT_VERSION_PREFIXES):
                     passed = False
             if not passed:
                 context.result.add_issue(
@@ -1,12 +1,18 @@
 from flask.testing import FlaskClient
 import pytest
 from unittest.mock import patch
-from app import create_app
+
+
+@pytest.fixture(scope="module")
+def app():
+    # The tests only send requests, so one application is shared by the whole module. It is imported here, so
+    # collecting the tests does not import the API:
+    from app import create_app
+    return create_app()
 
 
 @pytest.fixture
-def client():
-    app = create_app()
+def client(app):
     return app.test_client()
 
 
@@ -101,10 +107,10 @@ def test_validate_by_id_success(client: FlaskClient, crate_id: str, payload: dic
 
         response = client.post(f"/v1/ro_crates/{crate_id}/validation", json=payload)
 
-        minio_config = payload["minio_config"] if "minio_config" in payload else None
-        root_path = payload["root_path"] if "root_path" in payload else None
-        profile_name = payload["profile_name"] if "profile_name" in payload else None
-        webhook_url = payload["webhook_url"] if "webhook_url" in payload else None
+        minio_config = payload.get("minio_config")
+        root_path = payload.get("root_path")
+        profile_name = payload.get("profile_name")
+        webhook_url = payload.get("webhook_url")
         assert response.status_code == status_code
         assert response.json == response_json
         mock_queue.assert_called_once_with(minio_config, crate_id, root_path, profile_name, webhook_url, profiles_path)
@@ -161,15 +167,18 @@ def test_validate_fails_missing_elements(client: FlaskClient, crate_id: str, pay
 )
 def test_validate_metadata_success(client: FlaskClient, payload: dict, status_code: int,
                                    response_json: dict, profiles_path: str):
+    from app.utils.config import Config
+
     with patch("app.ro_crates.routes.post_routes.queue_ro_crate_metadata_validation_task") as mock_queue:
         mock_queue.return_value = (response_json, status_code)
 
         response = client.post("/v1/ro_crates/validate_metadata", json=payload)
 
-        crate_json = payload["crate_json"] if "crate_json" in payload else None
-        profile_name = payload["profile_name"] if "profile_name" in payload else None
+        crate_json = payload.get("crate_json")
+        profile_name = payload.get("profile_name")
 
-        mock_queue.assert_called_once_with(crate_json, profile_name, profiles_path=profiles_path)
+        mock_queue.assert_called_once_with(crate_json, profile_name, profiles_path=profiles_path,
+                                           result_timeout=Config.METADATA_VALIDATION_TIMEOUT)
         assert response.status_code == status_code
         assert response.json == response_json
 
@@ -243,31 +252,47 @@ def test_get_validation_by_id_failures(client: FlaskClient, crate_id: str, paylo
     assert response.status_code == status_code
 
 
-def test_get_validation_by_id_success(client):
-    crate_id = "crate-123"
-    payload = {
-        "minio_config": {
-            "endpoint": "localhost:9000",
-            "accesskey": "admin",
-            "secret": "password123",
-            "ssl": False,
-            "bucket": "test_bucket"
-        },
-        "root_path": "base_path"
-    }
-
+@pytest.mark.parametrize(
+    "payload, root_path",
+    [
+        (
+            {
+                "minio_config": {
+                    "endpoint": "localhost:9000",
+                    "accesskey": "admin",
+                    "secret": "password123",
+                    "ssl": False,
+                    "bucket": "test_bucket"
+                },
+                "root_path": "base_path"
+            }, "base_path"
+        ),
+        (
+            {
+                "minio_config": {
+                    "endpoint": "localhost:9000",
+                    "accesskey": "admin",
+                    "secret": "password123",
+                    "ssl": False,
+                    "bucket": "test_bucket"
+                }
+            }, None
+        ),
+    ],
+    ids=["success", "success_missing_root_path"]
+)
+def test_get_validation_by_id_success(client: FlaskClient, payload: dict, root_path: str):
     with patch("app.ro_crates.routes.get_routes.get_ro_crate_validation_task") as mock_get:
         mock_get.return_value = ({"status": "valid"}, 200)
 
-        response = client.get(f"/v1/ro_crates/{crate_id}/validation", json=payload)
+        response = client.get("/v1/ro_crates/crate-123/validation", json=payload)
 
         assert response.status_code == 200
         assert response.json == {"status": "valid"}
-        mock_get.assert_called_once_with(payload["minio_config"], "crate-123", "base_path")
+        mock_get.assert_called_once_with(payload["minio_config"], "crate-123", root_path)
 
 
-def test_get_validation_by_id_missing_root_path(client):
-    crate_id = "crate-123"
+def test_get_validation_by_id_invalid_api_usage(client):
     payload = {
         "minio_config": {
             "endpoint": "localhost:9000",
@@ -278,11 +303,37 @@ def test_get_validation_by_id_missing_root_path(client):
         }
     }
 
+    from app.utils.config import InvalidAPIUsage
+
     with patch("app.ro_crates.routes.get_routes.get_ro_crate_validation_task") as mock_get:
-        mock_get.return_value = ({"status": "valid"}, 200)
+        mock_get.side_effect = InvalidAPIUsage("No RO-Crate with prefix: crate-123", 400)
 
-        response = client.get(f"/v1/ro_crates/{crate_id}/validation", json=payload)
+        response = client.get("/v1/ro_crates/crate-123/validation", json=payload)
 
-        assert response.status_code == 200
-        assert response.json == {"status": "valid"}
-        mock_get.assert_called_once_with(payload["minio_config"], "crate-123", None)
+        assert response.status_code == 400
+        assert response.json == {"message": "No RO-Crate with prefix: crate-123"}
+
+
+# Test GET API: /v1/ro_crates/tasks/{task_id}
+
+def test_get_metadata_validation_by_task_id(client):
+    with patch("app.ro_crates.routes.get_routes.get_metadata_validation_task_result") as mock_get:
+        mock_get.return_value = ({"message": "Validation in progress", "task_id": "task-123"}, 202)
+
+        response = client.get("/v1/ro_crates/tasks/task-123")
+
+        assert response.status_code == 202
+        assert response.json == {"message": "Validation in progress", "task_id": "task-123"}
+        mock_get.assert_called_once_with("task-123")
+
+
+def test_get_metadata_validation_by_unknown_task_id(client):
+    from app.utils.config import InvalidAPIUsage
+
+    with patch("app.ro_crates.routes.get_routes.get_metadata_validation_task_result") as mock_get:
+        mock_get.side_effect = InvalidAPIUsage("No metadata validation task with ID: task-unknown", 404)
+
+        response = client.get("/v1/ro_crates/tasks/task-unknown")
+
+        assert response.status_code == 404
+        assert response.json == {"message": "No metadata validation task with ID: task-unknown"}
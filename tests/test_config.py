@@ -0,0 +1,46 @@
+import datetime
+import pytest
+
+from celery import Celery
+from kombu.serialization import dumps, loads
+
+from app.utils.config import CELERY_SERIALIZER, configure_celery_worker, orjson_dumps
+
+
+# Test function: orjson_dumps
+
+@pytest.mark.parametrize(
+        "body",
+        [
+            (({"@graph": [{"@id": "./"}]}, "ro-crate-1.1", None, None), {}, {"callbacks": None}),
+            {"status": "SUCCESS", "result": '{"passed": true}', "traceback": None},
+            {"value": 2 ** 70},
+            {"date_done": datetime.datetime(2025, 1, 1, 12, 30)},
+        ],
+        ids=["task_message", "task_result", "large_integer", "datetime"]
+)
+def test_orjson_serializer_matches_json(body):
+    configure_celery_worker(Celery())
+
+    content_type, content_encoding, payload = dumps(body, serializer=CELERY_SERIALIZER)
+    json_content_type, json_content_encoding, json_payload = dumps(body, serializer="json")
+
+    assert content_type == "application/x-orjson"
+    assert loads(payload, content_type, content_encoding) == loads(
+        json_payload, json_content_type, json_content_encoding
+    )
+
+
+def test_orjson_dumps_is_compact():
+    assert orjson_dumps({"passed": True, "issues": []}) == b'{"passed":true,"issues":[]}'
+
+
+# Test function: configure_celery_worker
+
+def test_configure_celery_worker_serializers():
+    celery = Celery()
+    configure_celery_worker(celery)
+
+    assert celery.conf.task_serializer == CELERY_SERIALIZER
+    assert celery.conf.result_serializer == CELERY_SERIALIZER
+    assert set(celery.conf.accept_content) == {CELERY_SERIALIZER, "json"}
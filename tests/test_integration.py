@@ -4,9 +4,22 @@ import time
 import requests
 import json
 import os
-import docker
 from minio import Minio
 import uuid
+from typing import Callable
+
+# The Docker SDK is only needed to run these tests, not to deselect them:
+docker = pytest.importorskip("docker")
+
+# Every test needs the docker compose services, so unit test runs can use -m "not integration":
+pytestmark = pytest.mark.integration
+
+# Seconds between polls for the services and validation results, doubling up to the maximum:
+POLL_INITIAL_DELAY = 0.2
+POLL_MAX_DELAY = 2.0
+
+# Lines of each service's log shown after a failed run:
+CONTAINER_LOG_LINES = 500
 
 
 @pytest.fixture(scope="session")
@@ -14,8 +27,20 @@ def docker_client():
     return docker.from_env()
 
 
+@pytest.fixture(scope="session")
+def http():
+    """One keep-alive session for all requests to the API."""
+    session = requests.Session()
+    session.headers.update({
+        "accept": "application/json",
+        "Content-Type": "application/json"
+    })
+    yield session
+    session.close()
+
+
 @pytest.fixture(scope="session", autouse=True)
-def docker_compose(docker_client):
+def docker_compose(request, docker_client):
     """Start Docker Compose before tests, shut down after."""
     print("Starting Docker Compose...")
 
@@ -25,15 +50,21 @@ def docker_compose(docker_client):
         ["docker", "compose", "-f", "docker-compose-develop.yml", "-p", PROJECT, "up", "-d"],
         check=True
     )
-    time.sleep(10)  # Wait for services to start — adjust as needed
+    # Wait for services to start:
+    wait_for_service("http://localhost:9000/minio/health/live")
+    wait_for_service("http://localhost:5001/openapi.json")
+    wait_for_celery_worker(docker_client, PROJECT)
 
     load_test_data_into_minio()
 
     yield  # Run the tests
 
-    for container in docker_client.containers.list():
-        if "cratey-validator" in container.name:
-            logs = container.logs().decode("utf-8")
+    # Only show the service logs when they are needed to investigate a failure:
+    if request.session.testsfailed:
+        for container in docker_client.containers.list(
+            filters={"label": f"com.docker.compose.project={PROJECT}"}
+        ):
+            logs = container.logs(tail=CONTAINER_LOG_LINES).decode("utf-8")
 
             print(f"\n======= Logs from {container.name} container =======")
             print(logs)
@@ -42,6 +73,71 @@ def docker_compose(docker_client):
     subprocess.run(["docker", "compose", "-p", PROJECT, "down", "-v"], check=True)
 
 
+def wait_for_service(url: str, timeout: float = 60):
+    """Poll a URL until it responds with 200, or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL_DELAY
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url).status_code == 200:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+    pytest.fail(f"{url} was not ready after {timeout} seconds")
+
+
+def wait_for_celery_worker(docker_client, project: str, timeout: float = 60):
+    """Poll the Celery worker's logs until it reports that it is ready, or the timeout passes."""
+    container = docker_client.containers.get(f"{project}-celery_worker-1")
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL_DELAY
+    while time.monotonic() < deadline:
+        if b" ready." in container.logs():
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+    pytest.fail(f"Celery worker was not ready after {timeout} seconds")
+
+
+def validation_result_exists(response: requests.Response) -> bool:
+    """Whether a GET of the validation result found a result, i.e. did not respond with 400."""
+    return response.status_code != 400
+
+
+def wait_for_validation_result(
+    http: requests.Session,
+    url: str,
+    payload: dict,
+    timeout: float = 80,
+    until: Callable[[requests.Response], bool] = validation_result_exists,
+) -> requests.Response:
+    """
+    GET the validation result until `until` returns True for the response, or fail once the timeout passes.
+
+    By default this waits until the result is no longer missing (400). Pass a stricter `until` when an earlier test
+    may already have stored a result for the same crate.
+    """
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL_DELAY
+    while time.monotonic() < deadline:
+        response = http.get(url, json=payload)
+
+        # Print response for debugging
+        print("Status Code:", response.status_code)
+        print("Response JSON:", response.json())
+
+        if until(response):
+            return response
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+    pytest.fail(f"The validation result at {url} was not ready after {timeout} seconds")
+
+
 def load_test_data_into_minio():
     """Connect to MinIO and upload test files."""
     minio_client = Minio(
@@ -66,24 +162,17 @@ def load_test_data_into_minio():
             minio_client.fput_object(bucket_name, object_name, file_path)
 
 
-def test_validate_metadata():
+def test_validate_metadata(http: requests.Session):
     url = "http://localhost:5001/v1/ro_crates/validate_metadata"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
-    # Load the JSON from file
+    # The API expects the JSON to be passed as a string, so the file is sent as it is
     filepath = os.path.join("tests/data", "ro-crate-metadata.json")
     with open(filepath, "r", encoding="utf-8") as f:
-        crate_json_data = json.load(f)
-
-    # The API expects the JSON to be passed as a string
-    payload = {
-        "crate_json": json.dumps(crate_json_data)
-    }
+        payload = {
+            "crate_json": f.read()
+        }
 
-    response = requests.post(url, json=payload, headers=headers)
+    response = http.post(url, json=payload)
 
     response_result = json.loads(response.json()['result'])
 
@@ -96,13 +185,9 @@ def test_validate_metadata():
     assert response_result['passed'] is True
 
 
-def test_no_rocrate_for_validation():
+def test_no_rocrate_for_validation(http: requests.Session):
     ro_crate = "ro_crate_10"
     url = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
     # The API expects the JSON to be passed as a string
     payload = {
@@ -115,7 +200,7 @@ def test_no_rocrate_for_validation():
         }
     }
 
-    response = requests.post(url, json=payload, headers=headers)
+    response = http.post(url, json=payload)
 
     response_result = response.json()
 
@@ -128,13 +213,9 @@ def test_no_rocrate_for_validation():
     assert response_result['message'] == f"No RO-Crate with prefix: {ro_crate}"
 
 
-def test_no_validation_result_for_missing_crate():
+def test_no_validation_result_for_missing_crate(http: requests.Session):
     ro_crate = "ro_crate_10"
     url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
     # The API expects the JSON to be passed as a string
     payload = {
@@ -148,7 +229,7 @@ def test_no_validation_result_for_missing_crate():
     }
 
     # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
+    response = http.get(url_get, json=payload)
     response_result = response.json()
 
     # Print response for debugging
@@ -160,13 +241,9 @@ def test_no_validation_result_for_missing_crate():
     assert response_result['message'] == f"No RO-Crate with prefix: {ro_crate}"
 
 
-def test_get_existing_validation_result():
+def test_get_existing_validation_result(http: requests.Session):
     ro_crate = "ro_crate_3"
     url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
     # The API expects the JSON to be passed as a string
     payload = {
@@ -180,7 +257,7 @@ def test_get_existing_validation_result():
     }
 
     # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
+    response = http.get(url_get, json=payload)
     response_result = response.json()
 
     # Print response for debugging
@@ -192,13 +269,9 @@ def test_get_existing_validation_result():
     assert response_result["passed"] is False
 
 
-def test_rocrate_not_validated_yet():
+def test_rocrate_not_validated_yet(http: requests.Session):
     ro_crate = "ro_crate_not_validated"
     url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
     # The API expects the JSON to be passed as a string
     payload = {
@@ -212,7 +285,7 @@ def test_rocrate_not_validated_yet():
     }
 
     # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
+    response = http.get(url_get, json=payload)
     response_result = response.json()
 
     # Print response for debugging
@@ -224,77 +297,18 @@ def test_rocrate_not_validated_yet():
     assert response_result['message'] == f"No validation result yet for RO-Crate: {ro_crate}"
 
 
-def test_zipped_rocrate_validation():
-    ro_crate = "ro_crate_1"
-    url_post = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
-    # The API expects the JSON to be passed as a string
-    payload = {
-        "minio_config": {
-            "endpoint": "minio:9000",
-            "accesskey": "minioadmin",
-            "secret": "minioadmin",
-            "ssl": False,
-            "bucket": "ro-crates"
-        }
-    }
-
-    # POST action and tests
-    response = requests.post(url_post, json=payload, headers=headers)
-    response_result = response.json()['message']
-
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    # Assertions
-    assert response.status_code == 202
-    assert response_result == "Validation in progress"
-
-    # wait for ro-crate to be validated
-    time.sleep(10)
-
-    # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
-    response_result = response.json()
-
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    start_time = time.time()
-    while response.status_code == 400:
-        time.sleep(10)
-        # GET action and tests
-        response = requests.get(url_get, json=payload, headers=headers)
-        response_result = response.json()
-        # Print response for debugging
-        print("Status Code:", response.status_code)
-        print("Response JSON:", response_result)
-
-        elapsed = time.time() - start_time
-        if elapsed > 60:
-            print("60 seconds passed. Exiting loop")
-            break
-
-    # Assertions
-    assert response.status_code == 200
-    assert response_result["passed"] is False
-
-
-def test_directory_rocrate_validation():
-    ro_crate = "ro_crate_2"
-    url_post = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
+@pytest.mark.parametrize(
+    "ro_crate, root_path",
+    [
+        ("ro_crate_1", None),
+        ("ro_crate_2", None),
+        ("ro_crate_4", "project_a"),
+        ("ro_crate_5", "project_a"),
+    ],
+    ids=["zipped", "directory", "zipped_in_subdirectory", "directory_in_subdirectory"]
+)
+def test_rocrate_validation(http: requests.Session, ro_crate: str, root_path: str):
+    url = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
 
     # The API expects the JSON to be passed as a string
     payload = {
@@ -306,9 +320,11 @@ def test_directory_rocrate_validation():
             "bucket": "ro-crates"
         }
     }
+    if root_path:
+        payload["root_path"] = root_path
 
     # POST action and tests
-    response = requests.post(url_post, json=payload, headers=headers)
+    response = http.post(url, json=payload)
     response_result = response.json()['message']
 
     # Print response for debugging
@@ -319,46 +335,20 @@ def test_directory_rocrate_validation():
     assert response.status_code == 202
     assert response_result == "Validation in progress"
 
-    # wait for ro-crate to be validated
-    time.sleep(10)
-
-    # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
+    # GET action and tests, once the ro-crate is validated
+    response = wait_for_validation_result(http, url, payload)
     response_result = response.json()
 
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    start_time = time.time()
-    while response.status_code == 400:
-        time.sleep(10)
-        # GET action and tests
-        response = requests.get(url_get, json=payload, headers=headers)
-        response_result = response.json()
-        # Print response for debugging
-        print("Status Code:", response.status_code)
-        print("Response JSON:", response_result)
-
-        elapsed = time.time() - start_time
-        if elapsed > 60:
-            print("60 seconds passed. Exiting loop")
-            break
-
     # Assertions
     assert response.status_code == 200
     assert response_result["passed"] is False
 
 
-def test_extra_profile_rocrate_validation():
+def test_extra_profile_rocrate_validation(http: requests.Session):
     ro_crate = "ro_crate_2"
     profile_name = "alpha-crate-0.1"
     url_post = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
     url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
     # The API expects the JSON to be passed as a string
     post_payload = {
@@ -382,7 +372,7 @@ def test_extra_profile_rocrate_validation():
     }
 
     # POST action and tests
-    response = requests.post(url_post, json=post_payload, headers=headers)
+    response = http.post(url_post, json=post_payload)
     response_result = response.json()['message']
 
     # Print response for debugging
@@ -393,44 +383,25 @@ def test_extra_profile_rocrate_validation():
     assert response.status_code == 202
     assert response_result == "Validation in progress"
 
-    # wait for ro-crate to be validated
-    time.sleep(10)
-
-    # GET action and tests
-    response = requests.get(url_get, json=get_payload, headers=headers)
+    # GET action and tests, once the ro-crate is validated. The crate's result from the default profile may already be
+    # stored by test_rocrate_validation, so wait for the result from this profile:
+    response = wait_for_validation_result(
+        http, url_get, get_payload,
+        until=lambda response: (
+            response.status_code == 200
+            and response.json()["validation_settings"]["profile_identifier"] == profile_name
+        )
+    )
     response_result = response.json()
 
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    start_time = time.time()
-    while response.status_code == 400:
-        time.sleep(10)
-        # GET action and tests
-        response = requests.get(url_get, json=get_payload, headers=headers)
-        response_result = response.json()
-        # Print response for debugging
-        print("Status Code:", response.status_code)
-        print("Response JSON:", response_result)
-
-        elapsed = time.time() - start_time
-        if elapsed > 60:
-            print("60 seconds passed. Exiting loop")
-            break
-
     # Assertions
     assert response.status_code == 200
     assert response_result["passed"] is False
 
 
-def test_ignore_rocrates_not_on_basepath():
+def test_ignore_rocrates_not_on_basepath(http: requests.Session):
     ro_crate = "ro_crate_4"
     url_post = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
 
     # The API expects the JSON to be passed as a string
     payload = {
@@ -444,7 +415,7 @@ def test_ignore_rocrates_not_on_basepath():
     }
 
     # POST action and tests
-    response = requests.post(url_post, json=payload, headers=headers)
+    response = http.post(url_post, json=payload)
     response_result = response.json()['message']
 
     # Print response for debugging
@@ -454,133 +425,3 @@ def test_ignore_rocrates_not_on_basepath():
     # Assertions
     assert response.status_code == 400
     assert response_result == "No RO-Crate with prefix: ro_crate_4"
-
-
-def test_zipped_rocrate_in_subdirectory_validation():
-    ro_crate = "ro_crate_4"
-    subdir_path = "project_a"
-    url_post = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
-    # The API expects the JSON to be passed as a string
-    payload = {
-        "minio_config": {
-            "endpoint": "minio:9000",
-            "accesskey": "minioadmin",
-            "secret": "minioadmin",
-            "ssl": False,
-            "bucket": "ro-crates"
-        },
-        "root_path" : subdir_path
-    }
-
-    # POST action and tests
-    response = requests.post(url_post, json=payload, headers=headers)
-    response_result = response.json()['message']
-
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    # Assertions
-    assert response.status_code == 202
-    assert response_result == "Validation in progress"
-
-    # wait for ro-crate to be validated
-    time.sleep(10)
-
-    # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
-    response_result = response.json()
-
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    start_time = time.time()
-    while response.status_code == 400:
-        time.sleep(10)
-        # GET action and tests
-        response = requests.get(url_get, json=payload, headers=headers)
-        response_result = response.json()
-        # Print response for debugging
-        print("Status Code:", response.status_code)
-        print("Response JSON:", response_result)
-
-        elapsed = time.time() - start_time
-        if elapsed > 60:
-            print("60 seconds passed. Exiting loop")
-            break
-
-    # Assertions
-    assert response.status_code == 200
-    assert response_result["passed"] is False
-
-
-def test_directory_rocrate_in_subdirectory_validation():
-    ro_crate = "ro_crate_5"
-    subdir_path = "project_a"
-    url_post = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    url_get = f"http://localhost:5001/v1/ro_crates/{ro_crate}/validation"
-    headers = {
-        "accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
-    # The API expects the JSON to be passed as a string
-    payload = {
-        "minio_config": {
-            "endpoint": "minio:9000",
-            "accesskey": "minioadmin",
-            "secret": "minioadmin",
-            "ssl": False,
-            "bucket": "ro-crates"
-        },
-        "root_path" : subdir_path
-    }
-
-    # POST action and tests
-    response = requests.post(url_post, json=payload, headers=headers)
-    response_result = response.json()['message']
-
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    # Assertions
-    assert response.status_code == 202
-    assert response_result == "Validation in progress"
-
-    # wait for ro-crate to be validated
-    time.sleep(10)
-
-    # GET action and tests
-    response = requests.get(url_get, json=payload, headers=headers)
-    response_result = response.json()
-
-    # Print response for debugging
-    print("Status Code:", response.status_code)
-    print("Response JSON:", response_result)
-
-    start_time = time.time()
-    while response.status_code == 400:
-        time.sleep(10)
-        # GET action and tests
-        response = requests.get(url_get, json=payload, headers=headers)
-        response_result = response.json()
-        # Print response for debugging
-        print("Status Code:", response.status_code)
-        print("Response JSON:", response_result)
-
-        elapsed = time.time() - start_time
-        if elapsed > 60:
-            print("60 seconds passed. Exiting loop")
-            break
-
-    # Assertions
-    assert response.status_code == 200
-    assert response_result["passed"] is False
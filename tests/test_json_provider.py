@@ -0,0 +1,66 @@
+import json
+import math
+from datetime import date, datetime, timezone
+import pytest
+from flask import Flask
+
+from app.utils.json_provider import ORJSONProvider
+
+
+@pytest.fixture
+def flask_app():
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    with app.app_context():
+        yield app
+
+
+# Test class: ORJSONProvider
+
+@pytest.mark.parametrize(
+        "data",
+        [
+            {"message": "Validation in progress"},
+            {"result": '{"passed": false, "issues": []}'},
+            {"b": [1, 2.5, None, True], "a": {"nested": "value"}},
+        ],
+        ids=["message", "nested_json_string", "mixed_types"]
+)
+def test_dumps_matches_stdlib(flask_app: Flask, data: dict):
+    assert json.loads(flask_app.json.dumps(data)) == data
+
+
+def test_dumps_sorts_keys(flask_app: Flask):
+    assert flask_app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+@pytest.mark.parametrize(
+        "value, expected",
+        [
+            (datetime(2024, 1, 1, tzinfo=timezone.utc), "Mon, 01 Jan 2024 00:00:00 GMT"),
+            (datetime(2024, 1, 1, 12, 30, 15), "Mon, 01 Jan 2024 12:30:15 GMT"),
+            (date(2024, 1, 1), "Mon, 01 Jan 2024 00:00:00 GMT"),
+        ],
+        ids=["aware_datetime", "naive_datetime", "date"]
+)
+def test_dumps_dates_as_http_date(flask_app: Flask, value, expected: str):
+    assert flask_app.json.dumps({"created": value}) == f'{{"created":"{expected}"}}'
+
+
+def test_response_is_json(flask_app: Flask):
+    response = flask_app.json.response({"status": "valid"})
+
+    assert response.mimetype == "application/json"
+    assert response.json == {"status": "valid"}
+
+
+def test_loads(flask_app: Flask):
+    assert flask_app.json.loads(b'{"status": "valid"}') == {"status": "valid"}
+
+
+def test_loads_matches_stdlib(flask_app: Flask):
+    data = flask_app.json.loads('{"big": 123456789012345678901234567890, "nan": NaN, "inf": Infinity}')
+
+    assert data["big"] == 123456789012345678901234567890
+    assert math.isnan(data["nan"])
+    assert data["inf"] == math.inf
@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import patch
+
+from rdflib.plugins.shared.jsonld import context as jsonld_context
+
+from app.utils.jsonld_cache import (
+    clear_jsonld_context_cache,
+    enable_jsonld_context_cache,
+    fetch_jsonld_context
+)
+
+
+RO_CRATE_CONTEXT = "https://w3id.org/ro/crate/1.1/context"
+
+
+@pytest.fixture(autouse=True)
+def empty_jsonld_context_cache():
+    clear_jsonld_context_cache()
+    yield
+    clear_jsonld_context_cache()
+
+
+# Test function: fetch_jsonld_context
+
+@patch("app.utils.jsonld_cache._source_to_json")
+def test_fetch_jsonld_context_reuses_remote_context(mock_source_to_json):
+    mock_source_to_json.return_value = ({"@context": {"name": "http://schema.org/name"}}, None)
+
+    first = fetch_jsonld_context(RO_CRATE_CONTEXT)
+    second = fetch_jsonld_context(RO_CRATE_CONTEXT)
+
+    assert first == second == mock_source_to_json.return_value
+    mock_source_to_json.assert_called_once_with(RO_CRATE_CONTEXT)
+
+
+@patch("app.utils.jsonld_cache._source_to_json")
+def test_fetch_jsonld_context_does_not_cache_errors(mock_source_to_json):
+    mock_source_to_json.side_effect = [OSError("Name or service not known"), ({"@context": {}}, None)]
+
+    with pytest.raises(OSError):
+        fetch_jsonld_context(RO_CRATE_CONTEXT)
+
+    assert fetch_jsonld_context(RO_CRATE_CONTEXT) == ({"@context": {}}, None)
+    assert mock_source_to_json.call_count == 2
+
+
+@patch("app.utils.jsonld_cache._source_to_json")
+def test_fetch_jsonld_context_skips_local_sources(mock_source_to_json):
+    mock_source_to_json.return_value = ({"@context": {}}, None)
+
+    fetch_jsonld_context("file:///app/context.jsonld")
+    fetch_jsonld_context("file:///app/context.jsonld")
+
+    assert mock_source_to_json.call_count == 2
+
+
+# Test function: enable_jsonld_context_cache
+
+@patch.object(jsonld_context, "source_to_json")
+def test_enable_jsonld_context_cache(mock_source_to_json):
+    enable_jsonld_context_cache()
+
+    assert jsonld_context.source_to_json is fetch_jsonld_context
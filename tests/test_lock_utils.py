@@ -0,0 +1,100 @@
+import pytest
+import redis
+from unittest.mock import MagicMock, patch
+
+from app.utils.lock_utils import (
+    acquire_validation_lock,
+    release_validation_lock,
+    validation_lock_key,
+    LOCK_PREFIX
+)
+
+
+MINIO_CONFIG = {
+    "endpoint": "localhost:9000",
+    "accesskey": "admin",
+    "secret": "password123",
+    "ssl": False,
+    "bucket": "test_bucket"
+}
+
+
+# Test function: validation_lock_key
+
+def test_lock_key_is_stable():
+    key = validation_lock_key(MINIO_CONFIG, "crate123", "base_path", "profileA", "https://example.com/hook")
+
+    assert key.startswith(LOCK_PREFIX)
+    assert key == validation_lock_key(MINIO_CONFIG, "crate123", "base_path", "profileA", "https://example.com/hook")
+
+
+@pytest.mark.parametrize(
+        "crate_id, root_path, profile_name, webhook_url",
+        [
+            ("crate124", "base_path", "profileA", "https://example.com/hook"),
+            ("crate123", None, "profileA", "https://example.com/hook"),
+            ("crate123", "base_path", None, "https://example.com/hook"),
+            ("crate123", "base_path", "profileA", None),
+        ],
+        ids=["different_crate", "different_root_path", "different_profile", "different_webhook"]
+)
+def test_lock_key_distinguishes_requests(crate_id: str, root_path: str, profile_name: str, webhook_url: str):
+    base_key = validation_lock_key(MINIO_CONFIG, "crate123", "base_path", "profileA", "https://example.com/hook")
+
+    assert validation_lock_key(MINIO_CONFIG, crate_id, root_path, profile_name, webhook_url) != base_key
+
+
+# Test function: acquire_validation_lock
+
+@pytest.mark.parametrize(
+        "set_return, acquired",
+        [(True, True), (None, False)],
+        ids=["lock_free", "lock_held"]
+)
+@patch("app.utils.lock_utils.get_redis_client")
+def test_acquire_lock(mock_get_client, set_return, acquired: bool):
+    mock_client = MagicMock()
+    mock_client.set.return_value = set_return
+    mock_get_client.return_value = mock_client
+
+    assert acquire_validation_lock("cratey:lock:abc") is acquired
+    args, kwargs = mock_client.set.call_args
+    assert args[0] == "cratey:lock:abc"
+    assert kwargs["nx"] is True
+
+
+@patch("app.utils.lock_utils.get_redis_client")
+def test_acquire_lock_without_redis(mock_get_client):
+    mock_get_client.return_value = None
+
+    assert acquire_validation_lock("cratey:lock:abc") is True
+
+
+@patch("app.utils.lock_utils.get_redis_client")
+def test_acquire_lock_redis_error(mock_get_client):
+    mock_client = MagicMock()
+    mock_client.set.side_effect = redis.ConnectionError("Redis down")
+    mock_get_client.return_value = mock_client
+
+    assert acquire_validation_lock("cratey:lock:abc") is True
+
+
+# Test function: release_validation_lock
+
+@patch("app.utils.lock_utils.get_redis_client")
+def test_release_lock(mock_get_client):
+    mock_client = MagicMock()
+    mock_get_client.return_value = mock_client
+
+    release_validation_lock("cratey:lock:abc")
+
+    mock_client.delete.assert_called_once_with("cratey:lock:abc")
+
+
+@patch("app.utils.lock_utils.get_redis_client")
+def test_release_lock_redis_error(mock_get_client):
+    mock_client = MagicMock()
+    mock_client.delete.side_effect = redis.ConnectionError("Redis down")
+    mock_get_client.return_value = mock_client
+
+    release_validation_lock("cratey:lock:abc")
@@ -1,4 +1,6 @@
+import gzip
 import json
+import os
 import pytest
 from io import BytesIO
 from minio import Minio
@@ -10,14 +12,26 @@ from unittest import mock
 @pytest.fixture
 def mock_minio_response():
     response = MagicMock()
-    response.data.decode.return_value = json.dumps({"status": "valid"})
+    response.read.return_value = json.dumps({"status": "valid"}).encode()
     return response
 
 
+@pytest.fixture(autouse=True)
+def worker_scratch_dir():
+    # Each test starts without the scratch directory a previous download created:
+    from app.utils.minio_utils import remove_worker_scratch_dir
+
+    remove_worker_scratch_dir()
+    yield
+    remove_worker_scratch_dir()
+
+
 class DummyObject:
-    def __init__(self, name, is_dir=False):
+    def __init__(self, name, is_dir=False, etag=None, size=None):
         self.object_name = name
         self.is_dir = is_dir
+        self.etag = etag
+        self.size = size
 
 
 # Testing function: get_minio_client
@@ -50,6 +64,17 @@ def test_get_minio_client_success(minio_config: dict):
     assert client._base_url.host == "localhost:9000"
 
 
+def test_get_minio_client_reused():
+    minio_config = {"endpoint": "localhost:9000", "accesskey": "admin", "secret": "password123", "ssl": False}
+
+    from app.utils.minio_utils import get_minio_client, MINIO_CONNECTION_POOL_SIZE
+    client = get_minio_client(minio_config)
+
+    assert get_minio_client(dict(minio_config, bucket="other_bucket")) is client
+    assert get_minio_client(dict(minio_config, secret="other_secret")) is not client
+    assert client._http.connection_pool_kw["maxsize"] == MINIO_CONNECTION_POOL_SIZE
+
+
 # Testing function: get_minio_object_list
 
 def test_get_minio_object_list_success():
@@ -110,6 +135,26 @@ def test_get_minio_object_list_errors(bucket: str, path: str, status_code: int,
     assert error_check in str(exc.value.message)
 
 
+# Testing function: iter_minio_objects
+
+def test_iter_minio_objects_stops_listing_early():
+    listed = []
+
+    def list_objects(bucket, prefix, recursive):
+        for name in ("rocrate123.zip", "rocrate123_validation/", "rocrate1234.zip"):
+            listed.append(name)
+            yield DummyObject(name)
+
+    mock_minio_client = MagicMock()
+    mock_minio_client.list_objects.side_effect = list_objects
+
+    from app.utils.minio_utils import find_rocrate_object_on_minio
+    result = find_rocrate_object_on_minio("rocrate123", mock_minio_client, "bucket", None)
+
+    assert result.object_name == "rocrate123.zip"
+    assert listed == ["rocrate123.zip"]
+
+
 # Testing function: find_rocrate_object_on_minio
 
 
@@ -131,7 +176,7 @@ def test_get_minio_object_list_errors(bucket: str, path: str, status_code: int,
     ],
     ids=["rocrate_directory", "rocrate_zip", "rootpath_none"]
 )
-@patch("app.utils.minio_utils.get_minio_object_list")
+@patch("app.utils.minio_utils.iter_minio_objects")
 def test_finding_rocrate_on_minio(
         mock_get_list,
         rocrate_object: DummyObject, crateid: str, bucket: str, root_path: str):
@@ -144,7 +189,7 @@ def test_finding_rocrate_on_minio(
     assert result == rocrate_object
 
 
-@patch("app.utils.minio_utils.get_minio_object_list")
+@patch("app.utils.minio_utils.iter_minio_objects")
 def test_rocrate_not_found(mock_get_list):
     # Simulate no matching object
     mock_get_list.return_value = [
@@ -160,6 +205,28 @@ def test_rocrate_not_found(mock_get_list):
     assert not result
 
 
+# Testing function: download_file_in_ranges_from_minio
+
+def test_download_file_in_ranges(tmp_path):
+    content = bytes(range(256)) * 10
+    mock_minio = MagicMock()
+
+    def get_object(bucket, object_path, offset, length):
+        response = MagicMock()
+        response.stream.return_value = [content[offset:offset + length]]
+        return response
+
+    mock_minio.get_object.side_effect = get_object
+    local_path = tmp_path / "rocrate.zip"
+
+    from app.utils.minio_utils import download_file_in_ranges_from_minio, MINIO_DOWNLOAD_WORKERS
+    download_file_in_ranges_from_minio(mock_minio, "bucket", "rocrate.zip", str(local_path), len(content))
+
+    assert local_path.read_bytes() == content
+    assert mock_minio.get_object.call_count == MINIO_DOWNLOAD_WORKERS
+    assert sum(call.kwargs["length"] for call in mock_minio.get_object.call_args_list) == len(content)
+
+
 # Testing function: find_validation_object_on_minio
 
 @pytest.mark.parametrize(
@@ -176,7 +243,7 @@ def test_rocrate_not_found(mock_get_list):
     ],
     ids=["with_storage_path", "without_storage_path"]
 )
-@patch("app.utils.minio_utils.get_minio_object_list")
+@patch("app.utils.minio_utils.iter_minio_objects")
 def test_validation_object_found_with_storage_path(
         mock_get_list,
         object_path: str, crateid: str, bucket: str, root_path: str):
@@ -207,7 +274,7 @@ def test_validation_object_found_with_storage_path(
     ],
     ids=["other_objects", "empty_list"]
 )
-@patch("app.utils.minio_utils.get_minio_object_list")
+@patch("app.utils.minio_utils.iter_minio_objects")
 def test_validation_object_not_found(
         mock_get_list,
         object_list: list, crateid: str, bucket: str, root_path: str):
@@ -220,18 +287,63 @@ def test_validation_object_not_found(
     assert result is False
 
 
+# Testing function: find_rocrate_and_validation_on_minio
+
+@pytest.mark.parametrize(
+    "object_list, root_path, crate_found, validation_exists",
+    [
+        (
+            [DummyObject("my/path/rocrate123.zip"), DummyObject("my/path/rocrate123_validation/", is_dir=True)],
+            "my/path", True, True
+        ),
+        (
+            [DummyObject("my/path/rocrate123/", is_dir=True)],
+            "my/path", True, False
+        ),
+        (
+            [DummyObject("rocrate123_validation/", is_dir=True)],
+            None, False, True
+        ),
+        (
+            [DummyObject("my/path/rocrate1234.zip"), DummyObject("my/path/rocrate1234_validation/", is_dir=True)],
+            "my/path", False, False
+        ),
+    ],
+    ids=["crate_and_validation", "crate_only", "validation_only", "other_crate"]
+)
+@patch("app.utils.minio_utils.iter_minio_objects")
+def test_find_rocrate_and_validation_on_minio(
+        mock_get_list, object_list: list, root_path: str, crate_found: bool, validation_exists: bool):
+    mock_get_list.return_value = object_list
+
+    from app.utils.minio_utils import find_rocrate_and_validation_on_minio
+    rocrate_object, validation_found = find_rocrate_and_validation_on_minio(
+        "rocrate123", "minio_client", "bucket", root_path
+    )
+
+    expected_prefix = f"{root_path}/rocrate123" if root_path else "rocrate123"
+    mock_get_list.assert_called_once_with(expected_prefix, "minio_client", "bucket")
+    assert bool(rocrate_object) is crate_found
+    assert validation_found is validation_exists
+
+
 # Testing function: download_file_from_minio
 
-@patch("app.utils.minio_utils.logging")
-def test_download_success(mock_logging):
+@patch("app.utils.minio_utils.logger")
+def test_download_success(mock_logger, tmp_path):
     mock_minio = MagicMock()
+    mock_minio.get_object.return_value.stream.return_value = [b"first ", b"second"]
+    local_path = tmp_path / "path.txt"
 
     from app.utils.minio_utils import download_file_from_minio
     # No exceptions raised
-    download_file_from_minio(mock_minio, "bucket", "remote/path.txt", "local/path.txt")
+    download_file_from_minio(mock_minio, "bucket", "remote/path.txt", str(local_path))
 
-    mock_minio.fget_object.assert_called_once_with("bucket", "remote/path.txt", "local/path.txt")
-    mock_logging.error.assert_not_called()
+    mock_minio.get_object.assert_called_once_with("bucket", "remote/path.txt", offset=0, length=0)
+    mock_minio.fget_object.assert_not_called()
+    assert local_path.read_bytes() == b"first second"
+    mock_minio.get_object.return_value.release_conn.assert_called_once()
+    mock_logger.error.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -260,14 +372,14 @@ def test_download_success(mock_logging):
         ],
         ids=["s3error", "value_error", "unexpected_error"]
 )
-@patch("app.utils.minio_utils.logging")
+@patch("app.utils.minio_utils.logger")
 def test_download_s3error(
-        mock_logging,
+        mock_logger,
         bucket: str, remotepath: str, localpath: str, status_code: int,
         get_side_effect, error_check: str
 ):
     mock_minio = MagicMock()
-    mock_minio.fget_object.side_effect = get_side_effect
+    mock_minio.get_object.side_effect = get_side_effect
 
     from app.utils.minio_utils import download_file_from_minio, InvalidAPIUsage
     with pytest.raises(InvalidAPIUsage) as exc:
@@ -275,7 +387,24 @@ def test_download_s3error(
 
     assert exc.value.status_code == status_code
     assert error_check in str(exc.value.message)
-    mock_logging.error.assert_called_once()
+    mock_logger.error.assert_called_once()
+
+
+# Testing function: validation_status_object_name
+
+@pytest.mark.parametrize(
+        "root_path, object_name",
+        [
+            (None, "crate123_validation/validation_status.txt"),
+            ("", "crate123_validation/validation_status.txt"),
+            ("base/path", "base/path/crate123_validation/validation_status.txt"),
+        ],
+        ids=["no_root_path", "empty_root_path", "root_path"]
+)
+def test_validation_status_object_name(root_path: str, object_name: str):
+    from app.utils.minio_utils import validation_status_object_name
+
+    assert validation_status_object_name("crate123", root_path) == object_name
 
 
 # Testing function: get_validation_status_from_minio
@@ -292,6 +421,16 @@ def test_successful_retrieval(mocker, mock_minio_response):
     mock_minio_response.release_conn.assert_called_once()
 
 
+def test_retrieval_of_compressed_result():
+    mock_client = MagicMock()
+    mock_client.get_object.return_value.read.return_value = gzip.compress(b'{"status": "valid"}')
+
+    from app.utils.minio_utils import get_validation_status_from_minio
+    result = get_validation_status_from_minio(mock_client, "test_bucket", "crate123", None)
+
+    assert result == {"status": "valid"}
+
+
 @pytest.mark.parametrize(
         "bucket, crateid, root_path, status_code, get_side_effect, error_check",
         [
@@ -333,6 +472,35 @@ def test_get_validation_error_raised(
     assert error_check in str(exc.value.message)
 
 
+def test_get_validation_releases_connection_on_invalid_json():
+    response = MagicMock()
+    response.read.return_value = b"not json"
+    mock_client = MagicMock()
+    mock_client.get_object.return_value = response
+
+    from app.utils.minio_utils import get_validation_status_from_minio, InvalidAPIUsage
+    with pytest.raises(InvalidAPIUsage) as exc:
+        get_validation_status_from_minio(mock_client, "test_bucket", "crate123", None)
+
+    assert exc.value.status_code == 500
+    response.close.assert_called_once()
+    response.release_conn.assert_called_once()
+
+
+def test_get_validation_status_missing_result():
+    mock_client = MagicMock()
+    mock_client.get_object.side_effect = S3Error(
+        code="NoSuchKey", message=None, resource=None, request_id=None, host_id=None, response=None
+    )
+
+    from app.utils.minio_utils import get_validation_status_from_minio, InvalidAPIUsage
+    with pytest.raises(InvalidAPIUsage) as exc:
+        get_validation_status_from_minio(mock_client, "test_bucket", "crate123", None)
+
+    assert exc.value.status_code == 400
+    assert exc.value.message == "No validation result yet for RO-Crate: crate123"
+
+
 # Testing function: update_validation_status_in_minio
 
 def test_update_validation_status_success():
@@ -362,9 +530,35 @@ def test_update_validation_status_success():
     assert object_name == expected_object_name
     assert isinstance(actual_data_stream, BytesIO)
     actual_data_stream.seek(0)
-    assert actual_data_stream.read() == expected_data
-    assert length == len(expected_data)
+    compressed_data = actual_data_stream.read()
+    assert gzip.decompress(compressed_data) == expected_data
+    assert length == len(compressed_data)
     assert kwargs["content_type"] == "application/json"
+    assert kwargs["metadata"] == {"Content-Encoding": "gzip"}
+
+
+def test_update_validation_status_bytes():
+    mock_minio_client = mock.Mock()
+    validation_status = b'{"status": "valid"}'
+
+    from app.utils.minio_utils import update_validation_status_in_minio
+    update_validation_status_in_minio(mock_minio_client, "test_bucket", "crate123", "", validation_status)
+
+    args, kwargs = mock_minio_client.put_object.call_args
+    assert gzip.decompress(kwargs["data"].getvalue()) == validation_status
+    assert kwargs["length"] == len(kwargs["data"].getvalue())
+
+
+def test_update_validation_status_stores_fingerprint():
+    mock_minio_client = mock.Mock()
+
+    from app.utils.minio_utils import update_validation_status_in_minio
+    update_validation_status_in_minio(
+        mock_minio_client, "test_bucket", "crate123", "", '{"status": "valid"}', fingerprint="abc123"
+    )
+
+    args, kwargs = mock_minio_client.put_object.call_args
+    assert kwargs["metadata"] == {"Content-Encoding": "gzip", "crate-fingerprint": "abc123"}
 
 
 @pytest.mark.parametrize(
@@ -411,6 +605,51 @@ def test_update_validation_status_erro(
     assert error_check in str(exc.value.message)
 
 
+# Testing function: get_worker_scratch_dir, remove_worker_scratch_dir
+
+@patch("app.utils.minio_utils.download_file_from_minio")
+@patch("app.utils.minio_utils.find_rocrate_object_on_minio")
+def test_fetch_rocrate_into_worker_scratch_dir(mock_find_object, mock_download, tmp_path):
+    mock_find_object.return_value = DummyObject("rocrate123.zip", is_dir=False)
+
+    from app.utils.minio_utils import fetch_ro_crate_from_minio, get_worker_scratch_dir
+
+    with patch("app.utils.minio_utils.Config.VALIDATION_TEMP_DIR", str(tmp_path)):
+        first = fetch_ro_crate_from_minio("minio_client", "test_bucket", "rocrate123", "")
+        second = fetch_ro_crate_from_minio("minio_client", "test_bucket", "rocrate123", "")
+
+    # The first download creates the scratch directory, which later downloads reuse:
+    scratch_dir = get_worker_scratch_dir()
+    assert os.path.dirname(scratch_dir) == str(tmp_path)
+    assert os.path.dirname(os.path.dirname(first)) == scratch_dir
+    assert os.path.dirname(os.path.dirname(second)) == scratch_dir
+    assert first != second
+
+
+@pytest.mark.parametrize(
+        "signal_name",
+        ["worker_shutdown", "worker_process_shutdown"],
+        ids=["gevent_threads_solo_pool", "prefork_pool"]
+)
+def test_worker_shutdown_removes_scratch_dir(signal_name: str, tmp_path):
+    from celery import signals
+
+    import app.celery_worker  # noqa: F401 - connects the worker signal handlers
+    from app.utils.minio_utils import get_worker_scratch_dir
+
+    with patch("app.utils.minio_utils.Config.VALIDATION_TEMP_DIR", str(tmp_path)):
+        scratch_dir = get_worker_scratch_dir()
+    os.mkdir(os.path.join(scratch_dir, "leftover_download"))
+
+    getattr(signals, signal_name).send(sender=None)
+
+    assert not os.path.exists(scratch_dir)
+
+    # A later download creates a new scratch directory:
+    with patch("app.utils.minio_utils.Config.VALIDATION_TEMP_DIR", str(tmp_path)):
+        assert get_worker_scratch_dir() != scratch_dir
+
+
 # Testing function: fetch_ro_crate_from_minio
 
 @patch("app.utils.minio_utils.download_file_from_minio")
@@ -441,6 +680,38 @@ def test_fetch_rocrate_zip(
         "some/path/rocrate123.zip", str(expected_path))
 
 
+@patch("app.utils.minio_utils.download_file_from_minio")
+@patch("app.utils.minio_utils.find_rocrate_object_on_minio")
+def test_fetch_rocrate_configured_temp_dir(mock_find_object, mock_download, tmp_path):
+    mock_find_object.return_value = DummyObject("rocrate123.zip", is_dir=False)
+
+    from app.utils.minio_utils import fetch_ro_crate_from_minio
+
+    with patch("app.utils.minio_utils.Config.VALIDATION_TEMP_DIR", str(tmp_path)):
+        result = fetch_ro_crate_from_minio("minio_client", "test_bucket", "rocrate123", "")
+
+    # <temp dir>/<worker scratch dir>/<download dir>/rocrate123.zip
+    assert os.path.dirname(os.path.dirname(os.path.dirname(result))) == str(tmp_path)
+    assert os.path.basename(result) == "rocrate123.zip"
+
+
+@patch("app.utils.minio_utils.download_file_in_ranges_from_minio")
+@patch("app.utils.minio_utils.download_file_from_minio")
+@patch("app.utils.minio_utils.find_rocrate_object_on_minio")
+def test_fetch_large_rocrate_in_ranges(mock_find_object, mock_download, mock_download_ranges, tmp_path):
+    from app.utils.minio_utils import fetch_ro_crate_from_minio, MINIO_RANGED_DOWNLOAD_THRESHOLD
+
+    mock_find_object.return_value = DummyObject("rocrate123.zip", is_dir=False, size=MINIO_RANGED_DOWNLOAD_THRESHOLD)
+
+    with patch("app.utils.minio_utils.tempfile.mkdtemp", return_value=str(tmp_path)):
+        result = fetch_ro_crate_from_minio("minio_client", "test_bucket", "rocrate123", "")
+
+    mock_download_ranges.assert_called_once_with(
+        "minio_client", "test_bucket", "rocrate123.zip", result, MINIO_RANGED_DOWNLOAD_THRESHOLD
+    )
+    mock_download.assert_not_called()
+
+
 @patch("app.utils.minio_utils.download_file_from_minio")
 @patch("app.utils.minio_utils.get_minio_object_list")
 @patch("app.utils.minio_utils.find_rocrate_object_on_minio")
@@ -470,6 +741,7 @@ def test_fetch_rocrate_directory(
         # Assert
         expected_root = tmp_path / "rocrate124"
         assert result == str(expected_root)
+        assert (expected_root / "data").is_dir()
         mock_download.assert_any_call(
             "minio_client", "test_bucket",
             "rocrates/rocrate124/metadata.json",
@@ -504,3 +776,188 @@ def test_fetch_rocrate_handles_empty_dir(
         expected_root = tmp_path / "rocrate456"
         assert result == str(expected_root)
         mock_download.assert_not_called()
+
+
+@patch("app.utils.minio_utils.download_file_from_minio")
+@patch("app.utils.minio_utils.find_rocrate_object_on_minio")
+def test_fetch_rocrate_missing_raises(mock_find_object, mock_download):
+    mock_find_object.return_value = False
+
+    from app.utils.minio_utils import fetch_ro_crate_from_minio, InvalidAPIUsage
+    with pytest.raises(InvalidAPIUsage) as exc:
+        fetch_ro_crate_from_minio("minio_client", "test_bucket", "rocrate789", "")
+
+    assert exc.value.status_code == 400
+    assert "No RO-Crate with prefix: rocrate789" in str(exc.value)
+    mock_download.assert_not_called()
+
+
+@patch("app.utils.minio_utils.download_file_from_minio")
+@patch("app.utils.minio_utils.get_minio_object_list")
+@patch("app.utils.minio_utils.find_rocrate_object_on_minio")
+def test_fetch_rocrate_directory_download_error(
+    mock_find_object,
+    mock_get_list,
+    mock_download,
+    tmp_path,
+):
+    mock_find_object.return_value = DummyObject("rocrates/rocrate124", is_dir=True)
+    mock_get_list.return_value = [
+        DummyObject("rocrates/rocrate124/metadata.json"),
+        DummyObject("rocrates/rocrate124/data/file1.txt"),
+    ]
+
+    from app.utils.minio_utils import fetch_ro_crate_from_minio, InvalidAPIUsage
+    mock_download.side_effect = [None, InvalidAPIUsage("MinIO S3 Error: NoSuchKey", 500)]
+
+    temp_dir = tmp_path / "download"
+    temp_dir.mkdir()
+    with patch("app.utils.minio_utils.tempfile.mkdtemp", return_value=str(temp_dir)):
+        with pytest.raises(InvalidAPIUsage) as exc:
+            fetch_ro_crate_from_minio("minio_client", "test_bucket", "rocrate124", "rocrates")
+
+    assert "MinIO S3 Error" in exc.value.message
+    assert mock_download.call_count == 2
+    assert not temp_dir.exists()
+
+
+# Testing function: get_ro_crate_fingerprint
+
+def test_ro_crate_fingerprint_zip():
+    rocrate = DummyObject("rocrates/crate123.zip", etag="etag1")
+
+    from app.utils.minio_utils import get_ro_crate_fingerprint
+    with patch("app.utils.minio_utils.find_rocrate_object_on_minio", return_value=rocrate):
+        fingerprint = get_ro_crate_fingerprint("minio_client", "test_bucket", "crate123", "rocrates", "profileA")
+
+        assert fingerprint == get_ro_crate_fingerprint(
+            "minio_client", "test_bucket", "crate123", "rocrates", "profileA"
+        )
+        assert fingerprint != get_ro_crate_fingerprint(
+            "minio_client", "test_bucket", "crate123", "rocrates", "profileB"
+        )
+
+        rocrate.etag = "etag2"
+        assert fingerprint != get_ro_crate_fingerprint(
+            "minio_client", "test_bucket", "crate123", "rocrates", "profileA"
+        )
+
+        rocrate.etag = "etag1"
+        assert fingerprint != get_ro_crate_fingerprint(
+            "minio_client", "test_bucket", "crate123", "rocrates", "profileA", validator_fingerprint="profiles"
+        )
+
+
+def test_ro_crate_fingerprint_dir():
+    rocrate = DummyObject("rocrates/crate123/", is_dir=True)
+    objects = [
+        DummyObject("rocrates/crate123/ro-crate-metadata.json", etag="etag1"),
+        DummyObject("rocrates/crate123/data.csv", etag="etag2"),
+    ]
+
+    from app.utils.minio_utils import get_ro_crate_fingerprint
+    with patch("app.utils.minio_utils.find_rocrate_object_on_minio", return_value=rocrate), \
+         patch("app.utils.minio_utils.get_minio_object_list") as mock_list:
+        mock_list.return_value = objects
+        fingerprint = get_ro_crate_fingerprint("minio_client", "test_bucket", "crate123", "rocrates", None)
+
+        mock_list.assert_called_once_with("rocrates/crate123/", "minio_client", "test_bucket", recursive=True)
+
+        mock_list.return_value = list(reversed(objects))
+        assert fingerprint == get_ro_crate_fingerprint("minio_client", "test_bucket", "crate123", "rocrates", None)
+
+        objects[1].etag = "etag3"
+        mock_list.return_value = objects
+        assert fingerprint != get_ro_crate_fingerprint("minio_client", "test_bucket", "crate123", "rocrates", None)
+
+
+@pytest.mark.parametrize(
+        "minio_error",
+        [False, True],
+        ids=["missing_crate", "minio_error"]
+)
+def test_ro_crate_fingerprint_unavailable(minio_error: bool):
+    from app.utils.minio_utils import get_ro_crate_fingerprint, InvalidAPIUsage
+    with patch("app.utils.minio_utils.find_rocrate_object_on_minio") as mock_find:
+        mock_find.return_value = False
+        if minio_error:
+            mock_find.side_effect = InvalidAPIUsage("MinIO S3 Error", 500)
+
+        assert get_ro_crate_fingerprint("minio_client", "test_bucket", "crate123", "", "profileA") is None
+
+
+# Testing function: get_cached_validation_status
+
+@pytest.mark.parametrize(
+        "fingerprint, stored_fingerprint, cache_hit",
+        [
+            ("abc123", "abc123", True),
+            ("abc123", "def456", False),
+            ("abc123", None, False),
+            (None, "abc123", False),
+        ],
+        ids=["matching_fingerprint", "changed_fingerprint", "no_stored_fingerprint", "no_fingerprint"]
+)
+def test_get_cached_validation_status(fingerprint: str, stored_fingerprint: str, cache_hit: bool):
+    mock_minio_client = MagicMock()
+    metadata = {"x-amz-meta-crate-fingerprint": stored_fingerprint} if stored_fingerprint else {}
+    mock_minio_client.stat_object.return_value = MagicMock(metadata=metadata)
+
+    from app.utils.minio_utils import get_cached_validation_status
+    with patch("app.utils.minio_utils.get_validation_status_from_minio") as mock_get:
+        mock_get.return_value = {"status": "valid"}
+        result = get_cached_validation_status(mock_minio_client, "test_bucket", "crate123", "rocrates", fingerprint)
+
+    if cache_hit:
+        assert result == {"status": "valid"}
+        mock_minio_client.stat_object.assert_called_once_with(
+            "test_bucket", "rocrates/crate123_validation/validation_status.txt"
+        )
+        mock_get.assert_called_once_with(mock_minio_client, "test_bucket", "crate123", "rocrates")
+    else:
+        assert result is None
+        mock_get.assert_not_called()
+
+
+def test_get_cached_validation_status_no_result():
+    mock_minio_client = MagicMock()
+    mock_minio_client.stat_object.side_effect = S3Error(
+        code="NoSuchKey", message=None, resource=None, request_id=None, host_id=None, response=None
+    )
+
+    from app.utils.minio_utils import get_cached_validation_status
+    assert get_cached_validation_status(mock_minio_client, "test_bucket", "crate123", "", "abc123") is None
+
+
+# Testing function: get_validation_status_etag
+
+@pytest.mark.parametrize(
+        "root_path, object_name",
+        [
+            ("rocrates", "rocrates/crate123_validation/validation_status.txt"),
+            ("", "crate123_validation/validation_status.txt"),
+        ],
+        ids=["with_root_path", "without_root_path"]
+)
+def test_get_validation_status_etag(root_path: str, object_name: str):
+    mock_minio_client = MagicMock()
+    mock_minio_client.stat_object.return_value = MagicMock(etag="etag1")
+
+    from app.utils.minio_utils import get_validation_status_etag
+    assert get_validation_status_etag(mock_minio_client, "test_bucket", "crate123", root_path) == "etag1"
+    mock_minio_client.stat_object.assert_called_once_with("test_bucket", object_name)
+
+
+@pytest.mark.parametrize(
+        "code",
+        ["NoSuchKey", "AccessDenied"],
+        ids=["no_result", "s3_error"]
+)
+def test_get_validation_status_etag_unavailable(code: str):
+    mock_minio_client = MagicMock()
+    mock_minio_client.stat_object.side_effect = S3Error(
+        code=code, message=None, resource=None, request_id=None, host_id=None, response=None
+    )
+
+    from app.utils.minio_utils import get_validation_status_etag
+    assert get_validation_status_etag(mock_minio_client, "test_bucket", "crate123", "") is None
@@ -0,0 +1,122 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from rocrate_validator.models import Profile, Severity
+
+from app.utils.profile_cache import (
+    _load_profiles_cached,
+    clear_profile_cache,
+    enable_profile_cache,
+    load_profiles,
+    profiles_fingerprint
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_profile_cache():
+    clear_profile_cache()
+    yield
+    clear_profile_cache()
+
+
+# Test function: load_profiles
+
+@patch.object(Profile, "_Profile__profiles_map")
+@patch("app.utils.profile_cache._load_profiles")
+def test_load_profiles_reuses_loaded_profiles(mock_load, mock_profiles_map):
+    profile = MagicMock(uri="https://w3id.org/ro/crate/1.1")
+    mock_load.return_value = [profile]
+
+    first = load_profiles(Profile, "/profiles", publicID="file://./")
+    second = load_profiles(Profile, "/profiles/", publicID="file://./")
+
+    assert first == second == [profile]
+    mock_load.assert_called_once_with(
+        Profile, "/profiles", extra_profiles_path=None, publicID="file://./",
+        severity=Severity.REQUIRED, allow_requirement_check_override=True
+    )
+    profile.get_requirements.assert_called_once_with()
+    assert mock_profiles_map.add.call_count == 2
+    mock_profiles_map.add.assert_called_with(profile.uri, profile)
+
+
+@pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"profiles_path": "/other_profiles"},
+            {"extra_profiles_path": "/extra_profiles"},
+            {"publicID": "file://./"},
+            {"severity": Severity.OPTIONAL},
+            {"allow_requirement_check_override": False},
+        ],
+        ids=["different_path", "extra_path", "different_public_id", "different_severity", "no_override"]
+)
+@patch.object(Profile, "_Profile__profiles_map")
+@patch("app.utils.profile_cache._load_profiles")
+def test_load_profiles_distinguishes_arguments(mock_load, mock_profiles_map, kwargs: dict):
+    mock_load.return_value = []
+
+    load_profiles(Profile, "/profiles")
+    load_profiles(Profile, **({"profiles_path": "/profiles"} | kwargs))
+
+    assert mock_load.call_count == 2
+
+
+@patch.object(Profile, "_Profile__profiles_map")
+@patch("app.utils.profile_cache._load_profiles")
+def test_load_profiles_bypasses_cache_for_crate_public_id(mock_load, mock_profiles_map):
+    profile = MagicMock(uri="https://w3id.org/ro/crate/1.1")
+    mock_load.return_value = [profile]
+
+    for public_id in ("file:///tmp/cratey-a/tmp1/", "file:///tmp/cratey-a/tmp2/"):
+        assert load_profiles(Profile, "/profiles", publicID=public_id) == [profile]
+
+    assert mock_load.call_count == 2
+    mock_load.assert_called_with(
+        Profile, "/profiles", extra_profiles_path=None, publicID="file:///tmp/cratey-a/tmp2/",
+        severity=Severity.REQUIRED, allow_requirement_check_override=True
+    )
+    assert _load_profiles_cached.cache_info().currsize == 0
+    profile.get_requirements.assert_not_called()
+    mock_profiles_map.add.assert_not_called()
+
+
+# Test function: enable_profile_cache
+
+@patch.object(Profile, "load_profiles")
+def test_enable_profile_cache(mock_load_profiles):
+    enable_profile_cache()
+
+    assert Profile.load_profiles.__func__ is load_profiles
+
+
+# Test function: profiles_fingerprint
+
+def test_profiles_fingerprint_changes_with_profiles(tmp_path):
+    shapes = tmp_path / "ro-crate" / "must" / "shapes.ttl"
+    shapes.parent.mkdir(parents=True)
+    shapes.write_text("ex:Shape a sh:NodeShape .")
+
+    fingerprint = profiles_fingerprint(str(tmp_path))
+    assert profiles_fingerprint(str(tmp_path) + "/") == fingerprint
+
+    # Profile edits are picked up once the cached fingerprints are discarded, as on a worker restart:
+    shapes.write_text("ex:Shape a sh:NodeShape ; sh:closed true .")
+    assert profiles_fingerprint(str(tmp_path)) == fingerprint
+    clear_profile_cache()
+    assert profiles_fingerprint(str(tmp_path)) != fingerprint
+
+
+def test_profiles_fingerprint_changes_with_validator_version(tmp_path):
+    fingerprint = profiles_fingerprint(str(tmp_path))
+    clear_profile_cache()
+
+    with patch("app.utils.profile_cache.rocrate_validator_version", "999.0.0"):
+        assert profiles_fingerprint(str(tmp_path)) != fingerprint
+
+
+def test_profiles_fingerprint_defaults_to_built_in_profiles(tmp_path):
+    from rocrate_validator.services import DEFAULT_PROFILES_PATH
+
+    assert profiles_fingerprint(None) == profiles_fingerprint(str(DEFAULT_PROFILES_PATH))
+    assert profiles_fingerprint(None) != profiles_fingerprint(str(tmp_path))
@@ -1,12 +1,17 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 from flask import Flask
 from flask.testing import FlaskClient
 
+from app.services import validation_service
 from app.services.validation_service import (
     queue_ro_crate_validation_task,
     queue_ro_crate_metadata_validation_task,
-    get_ro_crate_validation_task
+    get_ro_crate_validation_task,
+    get_metadata_validation_task_result,
+    check_ro_crate_exists_cached
 )
 
 from app.utils.minio_utils import InvalidAPIUsage
@@ -19,6 +24,15 @@ def flask_app():
         yield app
 
 
+@pytest.fixture(autouse=True)
+def clear_service_caches():
+    validation_service._rocrate_exists_cache.clear()
+    validation_service._validation_result_cache.clear()
+    yield
+    validation_service._rocrate_exists_cache.clear()
+    validation_service._validation_result_cache.clear()
+
+
 # Test function: queue_ro_crate_validation_task
 
 @pytest.mark.parametrize(
@@ -75,10 +89,10 @@ def test_queue_ro_crate_validation_task(
     mock_exists.return_value = rocrate_exists
     mock_client.return_value = minio_client
 
-    minio_config = payload["minio_config"] if "minio_config" in payload else None
-    root_path = payload["root_path"] if "root_path" in payload else None
-    profile_name = payload["profile_name"] if "profile_name" in payload else None
-    webhook_url = payload["webhook_url"] if "webhook_url" in payload else None
+    minio_config = payload.get("minio_config")
+    root_path = payload.get("root_path")
+    profile_name = payload.get("profile_name")
+    webhook_url = payload.get("webhook_url")
 
     response, status_code = queue_ro_crate_validation_task(minio_config, crate_id, root_path,
                                                            profile_name, webhook_url, profiles_path)
@@ -124,10 +138,10 @@ def test_queue_ro_crate_validation_task_failure(
     mock_exists.return_value = rocrate_exists
     mock_client.return_value = minio_client
 
-    minio_config = payload["minio_config"] if "minio_config" in payload else None
-    root_path = payload["root_path"] if "root_path" in payload else None
-    profile_name = payload["profile_name"] if "profile_name" in payload else None
-    webhook_url = payload["webhook_url"] if "webhook_url" in payload else None
+    minio_config = payload.get("minio_config")
+    root_path = payload.get("root_path")
+    profile_name = payload.get("profile_name")
+    webhook_url = payload.get("webhook_url")
 
     with pytest.raises(InvalidAPIUsage) as exc_info:
         queue_ro_crate_validation_task(minio_config, crate_id, root_path, profile_name, webhook_url)
@@ -138,6 +152,46 @@ def test_queue_ro_crate_validation_task_failure(
     mock_delay.assert_not_called()
 
 
+# Test function: check_ro_crate_exists_cached
+
+@patch("app.services.validation_service.check_ro_crate_exists")
+@patch("app.services.validation_service.get_minio_client")
+def test_check_ro_crate_exists_cached_reuses_positive_result(mock_client, mock_exists):
+    mock_client.return_value = "minio_client"
+    mock_exists.return_value = True
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+
+    assert check_ro_crate_exists_cached(minio_config, "crate123", "base_path") is True
+    assert check_ro_crate_exists_cached(minio_config, "crate123", "base_path") is True
+
+    mock_client.assert_called_once_with(minio_config)
+    mock_exists.assert_called_once_with("minio_client", "test_bucket", "crate123", "base_path")
+
+
+@patch("app.services.validation_service.check_ro_crate_exists")
+@patch("app.services.validation_service.get_minio_client")
+def test_check_ro_crate_exists_cached_does_not_cache_missing_crate(mock_client, mock_exists):
+    mock_client.return_value = "minio_client"
+    mock_exists.side_effect = [False, True]
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+
+    assert check_ro_crate_exists_cached(minio_config, "crate123", None) is False
+    assert check_ro_crate_exists_cached(minio_config, "crate123", None) is True
+    assert mock_exists.call_count == 2
+
+
 # Test function: queue_ro_crate_metadata_validation_task
 
 @pytest.mark.parametrize(
@@ -164,10 +218,11 @@ def test_queue_ro_crate_validation_task_failure(
         ],
         ids=["success_with_webhook", "success_without_webhook", "failure_celery_error"]
 )
-def test_queue_metadata(flask_app, crate_json: dict, profile: str, webhook: str,
+@patch("app.services.validation_service.process_validation_task_by_metadata.backend.store_result")
+def test_queue_metadata(mock_store, flask_app, crate_json: dict, profile: str, webhook: str,
                         status_code: int, return_value: dict, response_json: dict,
                         delay_side_effect: Exception, profiles_path: str):
-    with patch("app.services.validation_service.process_validation_task_by_metadata.delay",
+    with patch("app.services.validation_service.process_validation_task_by_metadata.apply_async",
                side_effect=delay_side_effect) as mock_delay:
         mock_result = MagicMock()
         if return_value is not None:
@@ -177,11 +232,36 @@ def test_queue_metadata(flask_app, crate_json: dict, profile: str, webhook: str,
 
         response, status = queue_ro_crate_metadata_validation_task(crate_json, profile, webhook, profiles_path)
 
-        mock_delay.assert_called_once_with(crate_json, profile, webhook, profiles_path)
+        task_id = mock_delay.call_args.kwargs["task_id"]
+        mock_delay.assert_called_once_with(
+            args=(json.loads(crate_json), profile, webhook, profiles_path), ignore_result=webhook is not None,
+            task_id=task_id
+        )
+        # Only a task whose ID can be returned is recorded as queued, before it is sent:
+        if webhook:
+            mock_store.assert_not_called()
+        else:
+            mock_store.assert_called_once_with(task_id, None, "QUEUED")
         assert status == status_code
         assert response.json == response_json
 
 
+def test_queue_metadata_timeout_returns_task_id(flask_app):
+    crate_json = '{"@context": "https://w3id.org/ro/crate/1.1/context"}'
+    with patch("app.services.validation_service.process_validation_task_by_metadata.apply_async") as mock_delay, \
+         patch("app.services.validation_service.process_validation_task_by_metadata.backend.store_result"):
+        mock_result = MagicMock()
+        mock_result.id = "task-123"
+        mock_result.get.side_effect = CeleryTimeoutError()
+        mock_delay.return_value = mock_result
+
+        response, status = queue_ro_crate_metadata_validation_task(crate_json, result_timeout=0.5)
+
+        mock_result.get.assert_called_once_with(timeout=0.5)
+        assert status == 202
+        assert response.json == {"message": "Validation in progress", "task_id": "task-123"}
+
+
 @pytest.mark.parametrize(
         "crate_json, status_code, response_error",
         [
@@ -197,15 +277,71 @@ def test_queue_metadata(flask_app, crate_json: dict, profile: str, webhook: str,
                 "{}",
                 422, "Required parameter crate_json is empty"
             ),
+            (
+                "  \n ",
+                422, "Missing required parameter: crate_json"
+            ),
+            (
+                " [] ",
+                422, "Required parameter crate_json is empty"
+            ),
+            (
+                "{ }",
+                422, "Required parameter crate_json is empty"
+            ),
         ],
-        ids=["missing_crate_json","invalid_json","empty_json"]
+        ids=["missing_crate_json", "invalid_json", "empty_json", "blank_json", "empty_list_json",
+             "empty_json_with_whitespace"]
 )
-def test_queue_metadata_json_errors(flask_app, crate_json: str, status_code: int, response_error: str):
+@patch("app.services.validation_service.process_validation_task_by_metadata.apply_async")
+def test_queue_metadata_json_errors(mock_delay, flask_app, crate_json: str, status_code: int, response_error: str):
     response, status = queue_ro_crate_metadata_validation_task(crate_json)
+    mock_delay.assert_not_called()
     assert status == status_code
     assert response_error in response.json["error"]
 
 
+# Test function: get_metadata_validation_task_result
+
+@pytest.mark.parametrize(
+        "state, ready, failed, task_result, status_code, response_json",
+        [
+            ("QUEUED", False, False, None, 202, {"message": "Validation in progress", "task_id": "task-123"}),
+            ("STARTED", False, False, None, 202, {"message": "Validation in progress", "task_id": "task-123"}),
+            ("SUCCESS", True, False, '{"passed": true}', 200, {"result": '{"passed": true}'}),
+            ("FAILURE", True, True, RuntimeError("Worker lost"), 500, {"error": "Worker lost"}),
+        ],
+        ids=["task_queued", "task_started", "task_succeeded", "task_failed"]
+)
+@patch("app.services.validation_service.process_validation_task_by_metadata.AsyncResult")
+def test_get_metadata_validation_task_result(
+    mock_async_result,
+    flask_app, state: str, ready: bool, failed: bool, task_result, status_code: int, response_json: dict
+):
+    mock_async_result.return_value.state = state
+    mock_async_result.return_value.ready.return_value = ready
+    mock_async_result.return_value.failed.return_value = failed
+    mock_async_result.return_value.result = task_result
+
+    response, status = get_metadata_validation_task_result("task-123")
+
+    mock_async_result.assert_called_once_with("task-123")
+    assert status == status_code
+    assert response.json == response_json
+
+
+@patch("app.services.validation_service.process_validation_task_by_metadata.AsyncResult")
+def test_get_metadata_validation_task_result_unknown_task(mock_async_result, flask_app):
+    # Celery reports task IDs it has no record of, including expired results, as PENDING:
+    mock_async_result.return_value.state = "PENDING"
+
+    with pytest.raises(InvalidAPIUsage) as exc_info:
+        get_metadata_validation_task_result("task-unknown")
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.message == "No metadata validation task with ID: task-unknown"
+
+
 # Test function: get_ro_crate_validation_task
 
 @pytest.mark.parametrize(
@@ -248,22 +384,21 @@ def test_queue_metadata_json_errors(flask_app, crate_json: str, status_code: int
         ],
         ids=["validation_exists", "rocrate_missing", "validation_missing"]
 )
-@patch("app.services.validation_service.check_ro_crate_exists")
-@patch("app.services.validation_service.check_validation_exists")
+@patch("app.services.validation_service.get_validation_status_etag", return_value="etag1")
+@patch("app.services.validation_service.check_ro_crate_and_validation_exist")
 @patch("app.services.validation_service.return_ro_crate_validation")
 @patch("app.services.validation_service.get_minio_client")
 def test_get_validation(
     mock_client,
     mock_return,
-    mock_validation,
-    mock_rocrate,
+    mock_exists,
+    mock_etag,
     flask_app, minio_config: dict, crate_id: str, crate_exists: bool,
     validation_exists: bool, validation_value: dict,
     status_code: int, error_message: str, minio_client: str
 ):
     mock_client.return_value = minio_client
-    mock_rocrate.return_value = crate_exists
-    mock_validation.return_value = validation_exists
+    mock_exists.return_value = (crate_exists, validation_exists)
     mock_return.return_value = validation_value
 
     if crate_exists and validation_exists:
@@ -271,8 +406,7 @@ def test_get_validation(
 
         mock_client.assert_called_once_with(minio_config)
         mock_return.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
-        mock_rocrate.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
-        mock_validation.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
+        mock_exists.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
 
         assert status == status_code
         assert response == validation_value
@@ -284,9 +418,143 @@ def test_get_validation(
             assert exc_info.value.status_code == status_code
             assert error_message in str(exc_info.value.message)
 
-            mock_rocrate.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
-            if crate_exists:
-                mock_validation.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
-            else:
-                mock_validation.assert_not_called()
+            mock_exists.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "base_path")
             mock_return.assert_not_called()
+
+
+@patch("app.services.validation_service.get_validation_status_etag", return_value="etag1")
+@patch("app.services.validation_service.check_ro_crate_and_validation_exist")
+@patch("app.services.validation_service.return_ro_crate_validation")
+@patch("app.services.validation_service.get_minio_client")
+def test_get_validation_served_from_cache(mock_client, mock_return, mock_exists, mock_etag, flask_app):
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+    mock_client.return_value = "minio_client"
+    mock_exists.return_value = (True, True)
+    mock_return.return_value = {"passed": True}
+
+    first, _ = get_ro_crate_validation_task(minio_config, "crate123", "base_path")
+    second, status = get_ro_crate_validation_task(minio_config, "crate123", "base_path")
+
+    assert first == second == {"passed": True}
+    assert status == 200
+    assert mock_etag.call_count == 2
+    assert mock_exists.call_count == 2
+    mock_return.assert_called_once()
+
+
+@pytest.mark.parametrize(
+        "exists, error_message",
+        [
+            ((False, True), "No RO-Crate with prefix: crate123"),
+            ((True, False), "No validation result yet for RO-Crate: crate123"),
+        ],
+        ids=["rocrate_removed", "validation_removed"]
+)
+@patch("app.services.validation_service.get_validation_status_etag", return_value="etag1")
+@patch("app.services.validation_service.check_ro_crate_and_validation_exist")
+@patch("app.services.validation_service.return_ro_crate_validation")
+@patch("app.services.validation_service.get_minio_client")
+def test_get_validation_cache_checks_existence(
+    mock_client, mock_return, mock_exists, mock_etag, flask_app, exists: tuple, error_message: str
+):
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+    mock_client.return_value = "minio_client"
+    mock_exists.side_effect = [(True, True), exists]
+    mock_return.return_value = {"passed": True}
+
+    get_ro_crate_validation_task(minio_config, "crate123", "base_path")
+    with pytest.raises(InvalidAPIUsage) as exc_info:
+        get_ro_crate_validation_task(minio_config, "crate123", "base_path")
+
+    assert exc_info.value.status_code == 400
+    assert error_message in str(exc_info.value.message)
+    mock_return.assert_called_once()
+
+
+@pytest.mark.parametrize(
+        "etags",
+        [
+            ["etag1", "etag2"],
+            ["etag1", None],
+        ],
+        ids=["result_replaced", "result_unavailable"]
+)
+@patch("app.services.validation_service.get_validation_status_etag")
+@patch("app.services.validation_service.check_ro_crate_and_validation_exist")
+@patch("app.services.validation_service.return_ro_crate_validation")
+@patch("app.services.validation_service.get_minio_client")
+def test_get_validation_not_served_stale(mock_client, mock_return, mock_exists, mock_etag, flask_app, etags: list):
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+    mock_client.return_value = "minio_client"
+    mock_exists.return_value = (True, True)
+    mock_etag.side_effect = etags
+    # A re-validation by any worker replaces the stored result, changing its ETag:
+    mock_return.side_effect = [{"passed": False}, {"passed": True}]
+
+    first, _ = get_ro_crate_validation_task(minio_config, "crate123", "base_path")
+    second, status = get_ro_crate_validation_task(minio_config, "crate123", "base_path")
+
+    assert first == {"passed": False}
+    assert second == {"passed": True}
+    assert mock_return.call_count == 2
+
+
+@patch("app.services.validation_service.process_validation_task_by_id.delay")
+@patch("app.services.validation_service.acquire_validation_lock")
+@patch("app.services.validation_service.check_ro_crate_exists_cached")
+def test_queue_validation_already_in_progress(mock_exists, mock_acquire, mock_delay, flask_app):
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+    mock_exists.return_value = True
+    mock_acquire.return_value = False
+
+    response, status = queue_ro_crate_validation_task(minio_config, "crate123")
+
+    assert status == 202
+    assert response.json == {"message": "Validation in progress"}
+    mock_delay.assert_not_called()
+
+
+@patch("app.services.validation_service.release_validation_lock")
+@patch("app.services.validation_service.process_validation_task_by_id.delay")
+@patch("app.services.validation_service.acquire_validation_lock")
+@patch("app.services.validation_service.check_ro_crate_exists_cached")
+def test_queue_validation_releases_lock_on_failure(mock_exists, mock_acquire, mock_delay, mock_release, flask_app):
+    minio_config = {
+        "endpoint": "localhost:9000",
+        "accesskey": "admin",
+        "secret": "password123",
+        "ssl": False,
+        "bucket": "test_bucket"
+    }
+    mock_exists.return_value = True
+    mock_acquire.return_value = True
+    mock_delay.side_effect = Exception("Celery down")
+
+    response, status = queue_ro_crate_validation_task(minio_config, "crate123")
+
+    assert status == 500
+    mock_release.assert_called_once_with(mock_acquire.call_args.args[0])
@@ -6,10 +6,13 @@ from app.tasks.validation_tasks import (
     process_validation_task_by_id,
     perform_ro_crate_validation,
     perform_metadata_validation,
+    validation_settings_kwargs,
     return_ro_crate_validation,
     process_validation_task_by_metadata,
     check_ro_crate_exists,
-    check_validation_exists
+    check_validation_exists,
+    check_ro_crate_and_validation_exist,
+    serialise_validation_result
 )
 
 from app.utils.minio_utils import InvalidAPIUsage
@@ -18,7 +21,7 @@ from app.utils.minio_utils import InvalidAPIUsage
 # Test function: process_validation_task_by_id
 
 @pytest.mark.parametrize(
-        "minio_config, crate_id, os_path_exists, os_path_isfile, os_path_isdir, " +
+        "minio_config, crate_id, " +
         "return_value, webhook, profile, profiles_path, val_success, val_result, minio_client",
         [
             (
@@ -29,7 +32,7 @@ from app.utils.minio_utils import InvalidAPIUsage
                         "ssl": False,
                         "bucket": "test_bucket"
                 },
-                "crate123", True, True, False, "/tmp/crate.zip",
+                "crate123", "/tmp/tmpabc/crate.zip",
                 "https://example.com/hook", "profileA", None, True, '{"status": "valid"}',
                 "minio_client"
             ),
@@ -41,7 +44,7 @@ from app.utils.minio_utils import InvalidAPIUsage
                         "ssl": False,
                         "bucket": "test_bucket"
                 },
-                "crate123", True, False, True, "/tmp/crate123",
+                "crate123", "/tmp/tmpabc/crate123",
                 "https://example.com/hook", "profileA", None, True, '{"status": "valid"}',
                 "minio_client"
             ),
@@ -53,20 +56,19 @@ from app.utils.minio_utils import InvalidAPIUsage
                         "ssl": False,
                         "bucket": "test_bucket"
                 },
-                "crate123", True, False, True, "/tmp/crate123",
+                "crate123", "/tmp/tmpabc/crate123",
                 None, "profileA", None, True, '{"status": "valid"}',
                 "minio_client"
             ),
         ],
         ids=["successful_validation_zip", "successful_validation_dir", "successful_validation_nowebhook"]
 )
+@mock.patch("app.tasks.validation_tasks.profiles_fingerprint", return_value="profiles")
+@mock.patch("app.tasks.validation_tasks.get_cached_validation_status", return_value=None)
+@mock.patch("app.tasks.validation_tasks.get_ro_crate_fingerprint", return_value="fingerprint")
 @mock.patch("app.tasks.validation_tasks.get_minio_client")
 @mock.patch("app.tasks.validation_tasks.shutil.rmtree")
-@mock.patch("app.tasks.validation_tasks.os.remove")
-@mock.patch("app.tasks.validation_tasks.os.path.exists")
-@mock.patch("app.tasks.validation_tasks.os.path.isfile")
-@mock.patch("app.tasks.validation_tasks.os.path.isdir")
-@mock.patch("app.tasks.validation_tasks.send_webhook_notification")
+@mock.patch("app.tasks.validation_tasks.deliver_webhook_notification.delay")
 @mock.patch("app.tasks.validation_tasks.update_validation_status_in_minio")
 @mock.patch("app.tasks.validation_tasks.perform_ro_crate_validation")
 @mock.patch("app.tasks.validation_tasks.fetch_ro_crate_from_minio")
@@ -75,24 +77,20 @@ def test_process_validation(
     mock_validate,
     mock_update,
     mock_webhook,
-    mock_isdir,
-    mock_isfile,
-    mock_exists,
-    mock_remove,
     mock_rmtree,
     mock_client,
-    minio_config: dict, crate_id: str, os_path_exists: bool, os_path_isfile: bool, os_path_isdir: bool,
+    mock_fingerprint,
+    mock_cached,
+    mock_profiles_fingerprint,
+    minio_config: dict, crate_id: str,
     return_value: str, webhook: str, profile: str, profiles_path: str, val_success: bool, val_result: str, minio_client: str
 ):
-    mock_exists.return_value = os_path_exists
-    mock_isfile.return_value = os_path_isfile
-    mock_isdir.return_value = os_path_isdir
     mock_fetch.return_value = return_value
     mock_client.return_value = minio_client
 
     mock_validation_result = mock.Mock()
     mock_validation_result.has_issues.return_value = val_success
-    mock_validation_result.to_json.return_value = val_result
+    mock_validation_result.to_dict.return_value = json.loads(val_result)
     mock_validate.return_value = mock_validation_result
 
     process_validation_task_by_id(minio_config, crate_id, "", profile, webhook, profiles_path)
@@ -100,21 +98,24 @@ def test_process_validation(
     mock_client.assert_called_once_with(minio_config)
     mock_fetch.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "")
     mock_validate.assert_called_once_with(return_value, profile, profiles_path=profiles_path)
-    mock_update.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "", val_result)
+    mock_profiles_fingerprint.assert_called_once_with(profiles_path)
+    mock_fingerprint.assert_called_once_with(
+        minio_client, minio_config["bucket"], crate_id, "", profile, validator_fingerprint="profiles"
+    )
+    mock_cached.assert_called_once_with(minio_client, minio_config["bucket"], crate_id, "", "fingerprint")
+    mock_update.assert_called_once_with(
+        minio_client, minio_config["bucket"], crate_id, "", val_result, fingerprint="fingerprint"
+    )
+    mock_validation_result.to_dict.assert_called_once_with()
     if webhook is not None:
         mock_webhook.assert_called_once_with(webhook, val_result)
     else:
         mock_webhook.assert_not_called()
-    if os_path_exists and os_path_isfile:
-        mock_remove.assert_called_once_with(return_value)
-        mock_rmtree.assert_not_called()
-    elif os_path_exists and os_path_isdir:
-        mock_rmtree.assert_called_once_with(return_value)
-        mock_remove.assert_not_called()
+    mock_rmtree.assert_called_once_with("/tmp/tmpabc", ignore_errors=True)
 
 
 @pytest.mark.parametrize(
-        "minio_config, crate_id, os_path_exists, os_path_isfile, os_path_isdir, return_fetch, "
+        "minio_config, crate_id, return_fetch, "
         + "webhook, profile, profiles_path, return_validate, validate_side_effect, fetch_side_effect, minio_client",
         [
             (
@@ -125,7 +126,7 @@ def test_process_validation(
                         "ssl": False,
                         "bucket": "test_bucket"
                 },
-                "crate123", True, True, False, "/tmp/crate.zip",
+                "crate123", "/tmp/tmpabc/crate.zip",
                 "https://example.com/hook", "profileA", None, "Validation failed", None, None,
                 "minio_client"
             ),
@@ -137,7 +138,7 @@ def test_process_validation(
                         "ssl": False,
                         "bucket": "test_bucket"
                 },
-                "crate123", True, True, False, "/tmp/crate.zip",
+                "crate123", "/tmp/tmpabc/crate.zip",
                 "https://example.com/hook", "profileA", None, None, Exception("Unexpected error"), None,
                 "minio_client"
             ),
@@ -149,7 +150,7 @@ def test_process_validation(
                         "ssl": False,
                         "bucket": "test_bucket"
                 },
-                "crate123", False, False, False, None,
+                "crate123", None,
                 "https://example.com/hook", "profileA", None, None, None, Exception("MinIO fetch failed"),
                 "minio_client"
             ),
@@ -157,13 +158,11 @@ def test_process_validation(
         ids=["validation_fails_with_message", "validation_fails_with_validation_exception",
              "validation_fails_with_fetch_exception"]
 )
+@mock.patch("app.tasks.validation_tasks.get_cached_validation_status", return_value=None)
+@mock.patch("app.tasks.validation_tasks.get_ro_crate_fingerprint", return_value="fingerprint")
 @mock.patch("app.tasks.validation_tasks.get_minio_client")
 @mock.patch("app.tasks.validation_tasks.shutil.rmtree")
-@mock.patch("app.tasks.validation_tasks.os.remove")
-@mock.patch("app.tasks.validation_tasks.os.path.exists")
-@mock.patch("app.tasks.validation_tasks.os.path.isfile")
-@mock.patch("app.tasks.validation_tasks.os.path.isdir")
-@mock.patch("app.tasks.validation_tasks.send_webhook_notification")
+@mock.patch("app.tasks.validation_tasks.deliver_webhook_notification.delay")
 @mock.patch("app.tasks.validation_tasks.update_validation_status_in_minio")
 @mock.patch("app.tasks.validation_tasks.perform_ro_crate_validation")
 @mock.patch("app.tasks.validation_tasks.fetch_ro_crate_from_minio")
@@ -172,19 +171,14 @@ def test_process_validation_failure(
     mock_validate,
     mock_update,
     mock_webhook,
-    mock_isdir,
-    mock_isfile,
-    mock_exists,
-    mock_remove,
     mock_rmtree,
     mock_client,
-    minio_config: dict, crate_id: str, os_path_exists: bool, os_path_isfile: bool, os_path_isdir: bool,
+    mock_fingerprint,
+    mock_cached,
+    minio_config: dict, crate_id: str,
     return_fetch: str, webhook: str, profile: str, profiles_path: str, return_validate: str,
     validate_side_effect: Exception, fetch_side_effect: Exception, minio_client: str
 ):
-    mock_exists.return_value = os_path_exists
-    mock_isfile.return_value = os_path_isfile
-    mock_isdir.return_value = os_path_isdir
     mock_client.return_value = minio_client
 
     if fetch_side_effect is None:
@@ -215,30 +209,65 @@ def test_process_validation_failure(
     else:
         assert return_validate in args[1]["error"]
 
-    if not os_path_exists:
-        mock_remove.assert_not_called()
-        mock_rmtree.assert_not_called()
-    elif os_path_exists and os_path_isfile:
-        mock_remove.assert_called_once_with(return_fetch)
+    if return_fetch is None:
         mock_rmtree.assert_not_called()
-    elif os_path_exists and os_path_isdir:
-        mock_rmtree.assert_called_once_with(return_fetch)
-        mock_remove.assert_not_called()
+    else:
+        mock_rmtree.assert_called_once_with("/tmp/tmpabc", ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+        "webhook",
+        ["https://example.com/hook", None],
+        ids=["unchanged_crate_webhook", "unchanged_crate_nowebhook"]
+)
+@mock.patch("app.tasks.validation_tasks.release_validation_lock")
+@mock.patch("app.tasks.validation_tasks.get_cached_validation_status")
+@mock.patch("app.tasks.validation_tasks.get_ro_crate_fingerprint", return_value="fingerprint")
+@mock.patch("app.tasks.validation_tasks.get_minio_client", return_value="minio_client")
+@mock.patch("app.tasks.validation_tasks.deliver_webhook_notification.delay")
+@mock.patch("app.tasks.validation_tasks.update_validation_status_in_minio")
+@mock.patch("app.tasks.validation_tasks.perform_ro_crate_validation")
+@mock.patch("app.tasks.validation_tasks.fetch_ro_crate_from_minio")
+def test_process_validation_unchanged_crate(
+    mock_fetch,
+    mock_validate,
+    mock_update,
+    mock_webhook,
+    mock_client,
+    mock_fingerprint,
+    mock_cached,
+    mock_release,
+    webhook: str
+):
+    minio_config = {"endpoint": "localhost:9000", "accesskey": "admin", "secret": "password123",
+                    "ssl": False, "bucket": "test_bucket"}
+    mock_cached.return_value = {"status": "valid"}
+
+    process_validation_task_by_id(minio_config, "crate123", "", "profileA", webhook, None)
+
+    mock_fetch.assert_not_called()
+    mock_validate.assert_not_called()
+    mock_update.assert_not_called()
+    if webhook is not None:
+        mock_webhook.assert_called_once_with(webhook, '{"status": "valid"}')
+    else:
+        mock_webhook.assert_not_called()
+    mock_release.assert_called_once()
 
 
 # Test function: process_validation_task_by_metadata
 
 @pytest.mark.parametrize(
-        "crate_json, profile_name, webhook_url, profiles_path, validation_json, validation_value",
+        "crate_metadata, profile_name, webhook_url, profiles_path, validation_json, validation_value",
         [
             (
-                '{"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []}',
+                {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []},
                 "test-profile", "https://example.com/webhook",
                 "/app/profiles",
                 '{"status": "valid"}', False
             ),
             (
-                '{"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []}',
+                {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []},
                 "test-profile", "https://example.com/webhook",
                 None,
                 '{"status": "invalid"}', True
@@ -246,40 +275,41 @@ def test_process_validation_failure(
         ],
         ids=["success_no_issues", "success_with_issues"]
 )
-@mock.patch("app.tasks.validation_tasks.send_webhook_notification")
+@mock.patch("app.tasks.validation_tasks.deliver_webhook_notification.delay")
 @mock.patch("app.tasks.validation_tasks.perform_metadata_validation")
 def test_metadata_validation(
     mock_validate, mock_webhook,
-    crate_json: str, profile_name: str, webhook_url: str, profiles_path: str | None,
+    crate_metadata: dict, profile_name: str, webhook_url: str, profiles_path: str | None,
     validation_json: str, validation_value: bool,
 ):
     mock_result = mock.Mock()
     mock_result.has_issues.return_value = validation_value
-    mock_result.to_json.return_value = validation_json
+    mock_result.to_dict.return_value = json.loads(validation_json)
     mock_validate.return_value = mock_result
 
     result = process_validation_task_by_metadata(
-        crate_json, profile_name, webhook_url, profiles_path
+        crate_metadata, profile_name, webhook_url, profiles_path
     )
 
     assert result == validation_json
     mock_validate.assert_called_once_with(
-        crate_json, profile_name, profiles_path=profiles_path
+        crate_metadata, profile_name, profiles_path=profiles_path
     )
     mock_webhook.assert_called_once_with(webhook_url, validation_json)
+    mock_result.to_dict.assert_called_once_with()
 
 
 @pytest.mark.parametrize(
-        "crate_json, profile_name, webhook_url, profiles_path, validation_message",
+        "crate_metadata, profile_name, webhook_url, profiles_path, validation_message",
         [
             (
-                '{"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []}',
+                {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []},
                 "test-profile", "https://example.com/webhook",
                 "/app/profiles",
                 "Validation error"
             ),
             (
-                '{"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []}',
+                {"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": []},
                 "test-profile", None,
                 None,
                 "Validation error"
@@ -287,24 +317,24 @@ def test_metadata_validation(
         ],
         ids=["validation_fails", "validation_fails_no_webhook"]
 )
-@mock.patch("app.tasks.validation_tasks.send_webhook_notification")
+@mock.patch("app.tasks.validation_tasks.deliver_webhook_notification.delay")
 @mock.patch("app.tasks.validation_tasks.perform_metadata_validation")
 def test_validation_fails_and_sends_error_notification_to_webhook(
     mock_validate, mock_webhook,
-    crate_json: str, profile_name: str, webhook_url: str, profiles_path: str | None,
+    crate_metadata: dict, profile_name: str, webhook_url: str, profiles_path: str | None,
     validation_message: str
 ):
 
     mock_validate.return_value = validation_message
 
     result = process_validation_task_by_metadata(
-        crate_json, profile_name, webhook_url, profiles_path
+        crate_metadata, profile_name, webhook_url, profiles_path
     )
 
     assert isinstance(result, str)
     assert validation_message in result
     mock_validate.assert_called_once_with(
-        crate_json, profile_name, profiles_path=profiles_path
+        crate_metadata, profile_name, profiles_path=profiles_path
     )
 
     if webhook_url is not None:
@@ -317,6 +347,47 @@ def test_validation_fails_and_sends_error_notification_to_webhook(
         mock_webhook.assert_not_called()
 
 
+@mock.patch("app.tasks.validation_tasks.deliver_webhook_notification.delay")
+@mock.patch("app.tasks.validation_tasks.perform_metadata_validation")
+def test_metadata_validation_unexpected_exception(mock_validate, mock_webhook):
+    mock_validate.side_effect = RuntimeError("Unexpected failure")
+
+    result = process_validation_task_by_metadata({"@graph": []}, "test-profile", "https://example.com/webhook")
+
+    assert result == "Unexpected failure"
+    mock_webhook.assert_called_once_with(
+        "https://example.com/webhook", {"profile_name": "test-profile", "error": "Unexpected failure"}
+    )
+
+
+# Test function: serialise_validation_result
+
+def test_serialise_validation_result():
+    mock_result = mock.Mock()
+    mock_result.to_dict.return_value = {"passed": False, "issues": [{"severity": "REQUIRED"}]}
+
+    result = serialise_validation_result(mock_result)
+
+    assert result == '{"passed": false, "issues": [{"severity": "REQUIRED"}]}'
+    mock_result.to_json.assert_not_called()
+
+
+# Test function: validation_settings_kwargs
+
+@pytest.mark.parametrize(
+        "profile_name, skip_checks, profiles_path, expected",
+        [
+            ("ro_profile", ["check1"], "/profiles",
+             {"metadata_only": True, "profile_identifier": "ro_profile", "skip_checks": ["check1"],
+              "profiles_path": "/profiles"}),
+            (None, [], None, {"metadata_only": True}),
+        ],
+        ids=["all_options", "no_options"]
+)
+def test_validation_settings_kwargs(profile_name: str, skip_checks: list, profiles_path: str, expected: dict):
+    assert validation_settings_kwargs(profile_name, skip_checks, profiles_path, metadata_only=True) == expected
+
+
 # Test function: perform_ro_crate_validation
 
 @pytest.mark.parametrize(
@@ -398,7 +469,7 @@ def test_metadata_validation_success_with_all_args(
     mock_result = mock.Mock()
     mock_validate.return_value = mock_result
 
-    result = perform_metadata_validation(crate_json, profile_name, skip_checks)
+    result = perform_metadata_validation(json.loads(crate_json), profile_name, skip_checks)
 
     # Assert that result was returned
     assert result == mock_result
@@ -422,8 +493,8 @@ def test_metadata_validation_success_with_all_args(
 @mock.patch("app.tasks.validation_tasks.services.validate", side_effect=RuntimeError("Validation error"))
 @mock.patch("app.tasks.validation_tasks.services.ValidationSettings")
 def test_metadata_validation_raises_exception_and_returns_string(mock_validation_settings, mock_validate):
-    crate_json = '{"id":"test metadata"}'
-    result = perform_metadata_validation(crate_json, "profile", skip_checks_list=None)
+    crate_metadata = {"id": "test metadata"}
+    result = perform_metadata_validation(crate_metadata, "profile", skip_checks_list=None)
 
     assert isinstance(result, str)
     assert "Validation error" in result
@@ -433,8 +504,8 @@ def test_metadata_validation_raises_exception_and_returns_string(mock_validation
 @mock.patch("app.tasks.validation_tasks.services.validate")
 @mock.patch("app.tasks.validation_tasks.services.ValidationSettings", side_effect=ValueError("Bad config"))
 def test_metadata_validation_settings_error(mock_validation_settings, mock_validate):
-    crate_json = '{"id":"test metadata"}'
-    result = perform_metadata_validation(crate_json, None)
+    crate_metadata = {"id": "test metadata"}
+    result = perform_metadata_validation(crate_metadata, None)
 
     assert isinstance(result, str)
     assert "Bad config" in result
@@ -523,3 +594,24 @@ def test_validation_exists(
 
     mock_find_validation.assert_called_once_with(crate_id, minio_client, bucket, base_path)
     assert result is validate_exists
+
+
+# Test function: check_ro_crate_and_validation_exist
+
+@pytest.mark.parametrize(
+        "find_return, expected",
+        [
+            (("rocrate_object", True), (True, True)),
+            (("rocrate_object", False), (True, False)),
+            ((False, True), (False, True)),
+        ],
+        ids=["crate_and_validation", "crate_only", "validation_only"]
+)
+@mock.patch("app.tasks.validation_tasks.find_rocrate_and_validation_on_minio")
+def test_ro_crate_and_validation_exist(mock_find, find_return: tuple, expected: tuple):
+    mock_find.return_value = find_return
+
+    result = check_ro_crate_and_validation_exist("minio_client", "test_bucket", "crate123", "base_path")
+
+    mock_find.assert_called_once_with("crate123", "minio_client", "test_bucket", "base_path")
+    assert result == expected
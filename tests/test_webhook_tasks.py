@@ -0,0 +1,65 @@
+import pytest
+import requests
+from unittest import mock
+
+from celery.exceptions import Retry
+
+from app.tasks.webhook_tasks import deliver_webhook_notification
+
+
+# Test function: deliver_webhook_notification
+
+@mock.patch("app.tasks.webhook_tasks.send_webhook_notification")
+def test_deliver_webhook_notification(mock_send):
+    deliver_webhook_notification("https://example.com/hook", {"status": "valid"})
+
+    mock_send.assert_called_once_with("https://example.com/hook", {"status": "valid"})
+
+
+@mock.patch("app.tasks.webhook_tasks.deliver_webhook_notification.retry", side_effect=Retry)
+@mock.patch("app.tasks.webhook_tasks.send_webhook_notification")
+def test_deliver_webhook_notification_retries_on_error(mock_send, mock_retry):
+    mock_send.side_effect = requests.ConnectionError("Connection refused")
+
+    with pytest.raises(Retry):
+        deliver_webhook_notification("https://example.com/hook", {"status": "valid"})
+
+    mock_retry.assert_called_once()
+
+
+# Test function: send_webhook_notification
+
+@mock.patch("app.utils.webhook_utils.requests.post")
+def test_send_webhook_notification_raises_on_http_error(mock_post):
+    mock_post.return_value.raise_for_status.side_effect = requests.HTTPError("503 Server Error")
+
+    from app.utils.webhook_utils import send_webhook_notification
+    with pytest.raises(requests.HTTPError):
+        send_webhook_notification("https://example.com/hook", {"status": "valid"})
+
+    mock_post.assert_called_once_with("https://example.com/hook", json={"status": "valid"})
+
+
+@pytest.mark.parametrize(
+        "data, body",
+        [
+            ('{"passed": true}', b'"{\\"passed\\": true}"'),
+            (
+                {"profile_name": None, "error": "Validation failed"},
+                b'{"profile_name": null, "error": "Validation failed"}'
+            ),
+        ],
+        ids=["serialised_report", "error_data"]
+)
+@mock.patch("requests.adapters.HTTPAdapter.send")
+def test_send_webhook_notification_body(mock_send, data, body: bytes):
+    mock_send.return_value = requests.Response()
+    mock_send.return_value.status_code = 200
+
+    from app.utils.webhook_utils import send_webhook_notification
+    send_webhook_notification("https://example.com/hook", data)
+
+    # Receivers get a serialised report as a JSON string literal, as before reports were serialised once:
+    request = mock_send.call_args.args[0]
+    assert request.body == body
+    assert request.headers["Content-Type"] == "application/json"